@@ -0,0 +1,90 @@
+import os
+
+from services.cache import SWRCache
+from services.metrics import metrics
+
+# ---------------- SHARED FIGURE CACHE ----------------
+# A figure depends only on the city's data, so every session viewing the same
+# reading gets the same chart. Figures are built once per (city, data version,
+# chart) and kept as Plotly JSON; each render only deserializes that JSON
+# instead of running Plotly Express again. Keys change when a new reading
+# arrives, so entries never go stale and the LRU bound handles eviction.
+FIGURE_CACHE_MAX = int(os.getenv("FIGURE_CACHE_MAX", "256"))
+
+_figures = SWRCache("figures", ttl=float("inf"), max_entries=FIGURE_CACHE_MAX, error_ttl=0)
+
+metrics.register_cache(_figures)
+
+TRANSPARENT = dict(plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)")
+HISTORY_POLLUTANTS = ["pm2_5", "pm10", "no2"]
+
+
+# ---------------- BUILDERS ----------------
+def _pollutant_frame(current):
+    import pandas as pd
+
+    return pd.DataFrame(current.pollutants.items(), columns=["Gas", "Value"])
+
+
+def _bar(current, history):
+    import plotly.express as px
+
+    fig = px.bar(_pollutant_frame(current), x="Gas", y="Value", color="Gas", title="Current Levels (µg/m³)", template="plotly_dark")
+    fig.update_layout(**TRANSPARENT)
+    return fig
+
+
+def _pie(current, history):
+    import plotly.express as px
+
+    fig = px.pie(_pollutant_frame(current), names="Gas", values="Value", hole=0.55, title="Atmospheric Composition %", template="plotly_dark")
+    fig.update_layout(**TRANSPARENT)
+    return fig
+
+
+def _area(current, history):
+    import plotly.express as px
+
+    df = history.to_frame()
+    available_cols = [col for col in HISTORY_POLLUTANTS if col in df.columns]
+    fig = px.area(df, x="recorded_at", y=available_cols, title="24-Hour Pollutant Volume", template="plotly_dark")
+    fig.update_layout(**TRANSPARENT)
+    return fig
+
+
+def _line(current, history):
+    import plotly.express as px
+
+    fig = px.line(history.to_frame(), x="recorded_at", y="aqi", title="AQI Stability Tracker", template="plotly_dark")
+    fig.update_traces(line=dict(width=4, color="#ef4444"))
+    fig.update_layout(**TRANSPARENT)
+    return fig
+
+
+# chart type -> (builder, which data it is drawn from)
+_charts = {
+    "bar": (_bar, "current"),
+    "pie": (_pie, "current"),
+    "area": (_area, "history"),
+    "line": (_line, "history"),
+}
+
+
+def figure_key(chart, current, history):
+    """Cache key for ``chart``: (city, recorded_at of the newest point it shows, chart)."""
+    _, source = _charts[chart]
+    version = current.recorded_at if source == "current" else history.latest_recorded_at
+    return (current.city, version, chart)
+
+
+def dashboard_figure(chart, current, history):
+    """Plotly figure ``chart`` ("bar", "pie", "area" or "line") for a ``CurrentAQI``/``AQIHistory`` pair."""
+    build, _ = _charts[chart]
+    key = figure_key(chart, current, history)
+    if key[1] is None:
+        # No timestamp to version the data by, so it cannot be shared safely.
+        return build(current, history)
+    import plotly.io as pio
+
+    spec = _figures.get(key, lambda: build(current, history).to_json())
+    return pio.from_json(spec, skip_invalid=True)
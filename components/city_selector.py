@@ -0,0 +1,131 @@
+import math
+import os
+from bisect import bisect_left
+from functools import lru_cache
+
+import streamlit as st
+
+# ---------------- CITY SEARCH INDEX ----------------
+# Built once per city list and shared by every session. Prefix lookups use a
+# sorted word index (bisect); the scan for the remaining matches is memoized
+# per query by city_matches.
+CITY_PAGE_SIZE = int(os.getenv("CITY_PAGE_SIZE", "12"))
+CITY_COLUMNS = 6
+
+
+class CityIndex:
+    """Prefix and fuzzy search over a fixed list of city names.
+
+    Results are ranked: names starting with the query, then names with a
+    word starting with it, then names containing it, then names containing
+    its letters in order (closest spans first). The last two need a scan,
+    which always runs so every page of results is complete.
+    """
+
+    def __init__(self, cities):
+        self.cities = tuple(cities)
+        self._folded = tuple(" ".join(c.casefold().replace("-", " ").split()) for c in self.cities)
+        words = sorted((word, i) for i, name in enumerate(self._folded) for word in name.split())
+        self._words = [word for word, _ in words]
+        self._word_positions = [i for _, i in words]
+
+    def _word_prefix(self, prefix):
+        start = bisect_left(self._words, prefix)
+        end = bisect_left(self._words, prefix + "\uffff")
+        return set(self._word_positions[start:end])
+
+    def search(self, query):
+        """City names matching ``query``, best first; every city for an empty query."""
+        q = " ".join(query.casefold().replace("-", " ").split())
+        if not q:
+            return list(self.cities)
+
+        ranked = []
+        for i in self._word_prefix(q.split()[0]):
+            name = self._folded[i]
+            if q in name:
+                ranked.append((0 if name.startswith(q) else 1, 0, name, i))
+        found = {i for *_, i in ranked}
+        letters = q.replace(" ", "")
+        for i, name in enumerate(self._folded):
+            if i in found:
+                continue
+            if q in name:
+                ranked.append((2, 0, name, i))
+            else:
+                span = _subsequence_span(letters, name)
+                if span is not None:
+                    ranked.append((3, span, name, i))
+        return [self.cities[i] for *_, i in sorted(ranked)]
+
+
+def _subsequence_span(letters, name):
+    """Length of the shortest-start span of ``name`` holding ``letters`` in order, or ``None``."""
+    start = pos = name.find(letters[0])
+    if start < 0:
+        return None
+    for ch in letters[1:]:
+        pos = name.find(ch, pos + 1)
+        if pos < 0:
+            return None
+    return pos - start
+
+
+@lru_cache(maxsize=8)
+def city_index(cities):
+    """Shared ``CityIndex`` for the tuple ``cities``."""
+    return CityIndex(cities)
+
+
+@lru_cache(maxsize=256)
+def city_matches(cities, query):
+    """``city_index(cities).search(query)`` as a tuple, memoized across reruns and sessions."""
+    return tuple(city_index(cities).search(query))
+
+
+# ---------------- SELECTOR ----------------
+def _set_page(key, page):
+    st.session_state[f"{key}_page"] = page
+
+
+def _button_grid(cities, key, columns):
+    clicked = None
+    cols = st.columns(columns)
+    for idx, city in enumerate(cities):
+        if cols[idx % columns].button(city, key=f"{key}_{city}", use_container_width=True):
+            clicked = city
+    return clicked
+
+
+def city_selector(cities, key="city_selector", page_size=CITY_PAGE_SIZE):
+    """Draw the city picker; returns the city clicked in this run, or ``None``.
+
+    Up to ``page_size`` cities render as one row of buttons. Longer lists get
+    a search box and pages of ``page_size`` results, so the number of widgets
+    drawn per run stays the same however many cities there are.
+    """
+    cities = tuple(cities)
+    if len(cities) <= page_size:
+        return _button_grid(cities, key, columns=max(1, len(cities)))
+
+    query = st.text_input(
+        "Search stations", key=f"{key}_query", placeholder=f"Search {len(cities)} stations...",
+        label_visibility="collapsed", on_change=_set_page, args=(key, 0),
+    )
+    matches = city_matches(cities, query)
+    if not matches:
+        st.caption(f"No station matches \"{query}\".")
+        return None
+
+    pages = math.ceil(len(matches) / page_size)
+    page = min(st.session_state.get(f"{key}_page", 0), pages - 1)
+    clicked = _button_grid(matches[page * page_size:(page + 1) * page_size], key, columns=CITY_COLUMNS)
+
+    if pages > 1:
+        prev_col, info_col, next_col = st.columns([1, 4, 1])
+        prev_col.button("‹ Prev", key=f"{key}_prev", disabled=page == 0,
+                        on_click=_set_page, args=(key, page - 1), use_container_width=True)
+        info_col.caption(f"Page {page + 1} of {pages} • {len(matches)} stations")
+        next_col.button("Next ›", key=f"{key}_next", disabled=page == pages - 1,
+                        on_click=_set_page, args=(key, page + 1), use_container_width=True)
+    return clicked
@@ -0,0 +1,64 @@
+import hmac
+import os
+
+import streamlit as st
+
+from services.api_client import get_backend_status
+from services.metrics import metrics
+
+# ---------------- ACCESS GATE ----------------
+# Not a file under pages/, so it never appears in the sidebar navigation.
+# Home.py renders it instead of the homepage only for
+# ?view=diagnostics&key=<SKYGUARD_DIAGNOSTICS_KEY>; any other request,
+# including a wrong key, just gets the homepage.
+DIAGNOSTICS_KEY = os.getenv("SKYGUARD_DIAGNOSTICS_KEY")
+
+
+def diagnostics_requested():
+    params = st.query_params
+    if not DIAGNOSTICS_KEY or params.get("view") != "diagnostics":
+        return False
+    # Constant-time comparison, so response timing does not reveal the key.
+    return hmac.compare_digest(params.get("key", "").encode(), DIAGNOSTICS_KEY.encode())
+
+
+def render_diagnostics():
+    """Backend circuit breakers, latency percentiles, counters and a Prometheus dump."""
+    st.set_page_config(page_title="SkyGuard | Diagnostics", page_icon="🛠️", layout="wide")
+    st.title("Backend Diagnostics")
+
+    # ---------------- CIRCUIT BREAKERS ----------------
+    status = get_backend_status()
+    st.subheader("Circuit Breakers")
+    st.dataframe(
+        [{"endpoint": path, **state} for path, state in status["breakers"].items()],
+        use_container_width=True,
+    )
+
+    # ---------------- LATENCY ----------------
+    st.subheader("Backend Latency (ms)")
+    latency = [
+        {
+            "endpoint": row["endpoint"],
+            "calls": row["count"],
+            **{k: round(row[k] * 1000, 1) for k in ("mean", "p50", "p95", "p99") if row[k] is not None},
+        }
+        for row in metrics.latency_summary("backend_request_seconds")
+    ]
+    if latency:
+        st.dataframe(latency, use_container_width=True)
+    else:
+        st.caption("No backend calls recorded yet in this process.")
+
+    # ---------------- COUNTERS ----------------
+    st.subheader("Requests, Retries, Errors & Cache")
+    st.dataframe(
+        [{"metric": name, **labels, "value": value} for name, labels, value in metrics.counters()],
+        use_container_width=True,
+    )
+
+    # ---------------- PROMETHEUS DUMP ----------------
+    prometheus_text = metrics.render_prometheus()
+    with st.expander("Prometheus text format"):
+        st.code(prometheus_text, language="text")
+    st.download_button("Download metrics.prom", prometheus_text, file_name="metrics.prom", mime="text/plain")
@@ -0,0 +1,167 @@
+import base64
+import io
+import math
+import os
+
+from services.cache import SWRCache
+from services.metrics import metrics
+
+# ---------------- INTERPOLATED HEAT LAYER ----------------
+# Fills the gaps between stations by inverse-distance weighting the snapshot's
+# readings onto a fixed-size grid. The image depends only on the snapshot and
+# the station coordinates, so it is computed once per data refresh and shared
+# by every session; its size depends on HEAT_GRID, not on the station count.
+HEAT_ENABLED = os.getenv("HEAT_ENABLED", "1") == "1"
+HEAT_FIELD = os.getenv("HEAT_FIELD", "aqi")  # "aqi" or a pollutant, e.g. "pm2_5"
+HEAT_GRID = int(os.getenv("HEAT_GRID", "192"))  # cells along the longer side
+HEAT_POWER = float(os.getenv("HEAT_POWER", "2"))
+HEAT_RADIUS_KM = float(os.getenv("HEAT_RADIUS_KM", "400"))  # fades out beyond this
+HEAT_OPACITY = float(os.getenv("HEAT_OPACITY", "0.45"))
+HEAT_PADDING_DEG = float(os.getenv("HEAT_PADDING_DEG", "3"))
+HEAT_CACHE_MAX = int(os.getenv("HEAT_CACHE_MAX", "8"))
+
+# Values at which the map's marker colours (AQI 1-5) are reached.
+HEAT_SCALES = {
+    "aqi": (1, 2, 3, 4, 5),
+    "pm2_5": (0, 10, 25, 50, 75),
+    "pm10": (0, 20, 50, 100, 200),
+}
+HEAT_COLORS = ("#22c55e", "#84cc16", "#eab308", "#f97316", "#ef4444")
+
+# Web Mercator's latitude limit; the map (and the grid) cannot go further.
+MERCATOR_MAX_LAT = 85.0511
+
+# Rows x stations distances computed at once; bounds memory for large grids.
+_CHUNK_CELLS = 1 << 21
+
+_heat = SWRCache("heat_layer", ttl=float("inf"), max_entries=HEAT_CACHE_MAX, error_ttl=0)
+
+metrics.register_cache(_heat)
+
+
+def station_values(snapshot, coords, field=HEAT_FIELD):
+    """``(lats, lons, values)`` of the stations in ``snapshot`` with coordinates and a ``field`` reading."""
+    rows = []
+    for city, data in snapshot.items():
+        if data is None or city not in coords:
+            continue
+        value = data.aqi if field == "aqi" else data.pollutants[field]
+        if value is not None:
+            rows.append((*coords[city], value))
+    return tuple(map(list, zip(*rows))) if rows else ([], [], [])
+
+
+def _mercator_y(lat):
+    return math.log(math.tan(math.pi / 4 + math.radians(lat) / 2))
+
+
+def grid_axes(bounds, size=HEAT_GRID):
+    """Cell-centre latitudes (north to south) and longitudes for ``bounds``.
+
+    Rows are evenly spaced in Web Mercator, like the map the image is drawn
+    on, so the overlay is not stretched north-south.
+    """
+    import numpy as np
+
+    (south, west), (north, east) = bounds
+    y0, y1 = _mercator_y(south), _mercator_y(north)
+    x_span = math.radians(east - west)
+    width = size if x_span >= y1 - y0 else max(1, round(size * x_span / (y1 - y0)))
+    height = size if y1 - y0 >= x_span else max(1, round(size * (y1 - y0) / x_span))
+    ys = y1 - (np.arange(height) + 0.5) * (y1 - y0) / height
+    lats = np.degrees(2 * np.arctan(np.exp(ys)) - np.pi / 2)
+    lons = west + (np.arange(width) + 0.5) * (east - west) / width
+    return lats, lons
+
+
+def idw_grid(lats, lons, values, grid_lats, grid_lons, power=HEAT_POWER):
+    """Inverse-distance-weighted ``values`` on the grid, and each cell's distance (km) to the nearest station.
+
+    Distances are equirectangular, which is accurate to well under a percent
+    at the few-hundred-kilometre scale that dominates the weights.
+    """
+    import numpy as np
+
+    lats, lons, values = (np.asarray(a, dtype=np.float32) for a in (lats, lons, values))
+    cols = grid_lons.size
+    estimate = np.empty((grid_lats.size, cols), dtype=np.float32)
+    nearest = np.empty_like(estimate)
+    step = max(1, _CHUNK_CELLS // max(1, cols * lats.size))
+    for top in range(0, grid_lats.size, step):
+        row_lats = grid_lats[top:top + step, None, None].astype(np.float32)
+        dy = (row_lats - lats) * np.float32(110.574)
+        dx = (grid_lons[None, :, None].astype(np.float32) - lons) * (np.float32(111.320) * np.cos(np.radians(row_lats)))
+        d2 = np.maximum(dx * dx + dy * dy, np.float32(1e-6))
+        # Read the nearest distance first: for power 2 the weights below are
+        # d2 itself, inverted in place.
+        nearest[top:top + step] = np.sqrt(d2.min(axis=2))
+        # Squared distances avoid a sqrt per cell and station; weights = d^-power.
+        weights = d2 if power == 2 else d2 ** np.float32(power / 2)
+        np.reciprocal(weights, out=weights)
+        estimate[top:top + step] = (weights @ values) / weights.sum(axis=2)
+    return estimate, nearest
+
+
+def colorize(estimate, nearest, field=HEAT_FIELD, radius_km=HEAT_RADIUS_KM, opacity=HEAT_OPACITY):
+    """RGBA ``uint8`` image: the marker colour ramp, fading out past ``radius_km`` from any station."""
+    import numpy as np
+
+    scale = HEAT_SCALES.get(field, HEAT_SCALES["aqi"])
+    ramp = np.array([[int(c[i:i + 2], 16) for i in (1, 3, 5)] for c in HEAT_COLORS], dtype=np.float64)
+    rgba = np.empty(estimate.shape + (4,), dtype=np.uint8)
+    for channel in range(3):
+        rgba[..., channel] = np.interp(estimate, scale, ramp[:, channel])
+    fade = np.clip(2 - 2 * nearest / radius_km, 0, 1)  # full within radius/2, none beyond radius
+    rgba[..., 3] = (255 * opacity * fade).astype(np.uint8)
+    return rgba
+
+
+def heat_bounds(lats, lons, padding=HEAT_PADDING_DEG):
+    """Padded station extent, with latitudes clamped to what Web Mercator can project."""
+    south = max(min(lats) - padding, -MERCATOR_MAX_LAT)
+    north = min(max(lats) + padding, MERCATOR_MAX_LAT)
+    return [[south, min(lons) - padding], [north, max(lons) + padding]]
+
+
+def _render(snapshot, coords, field):
+    lats, lons, values = station_values(snapshot, coords, field)
+    if not values:
+        return None
+    from PIL import Image
+
+    bounds = heat_bounds(lats, lons)
+    if bounds[0][0] >= bounds[1][0]:
+        return None  # every station lies beyond the map's latitude limit
+    grid_lats, grid_lons = grid_axes(bounds)
+    image = colorize(*idw_grid(lats, lons, values, grid_lats, grid_lons), field=field)
+    png = io.BytesIO()
+    Image.fromarray(image).save(png, format="PNG")
+    return png.getvalue(), bounds
+
+
+def heat_layer_png(snapshot, coords, field=HEAT_FIELD):
+    """``(png_bytes, [[south, west], [north, east]])`` of the heat layer, or ``None`` without data."""
+    if snapshot is None:
+        return None
+    if not getattr(snapshot, "version", None):
+        return _render(snapshot, coords, field)
+    key = (snapshot.version, field, tuple(sorted((city, tuple(ll)) for city, ll in coords.items())))
+    return _heat.get(key, lambda: _render(snapshot, coords, field))
+
+
+def add_heat_layer(m, snapshot, coords, field=HEAT_FIELD):
+    """Add the heat layer to folium map ``m`` as a toggleable image overlay."""
+    if not HEAT_ENABLED:
+        return
+    layer = heat_layer_png(snapshot, coords, field)
+    if layer is None:
+        return
+    import folium
+
+    png, bounds = layer
+    folium.raster_layers.ImageOverlay(
+        image="data:image/png;base64," + base64.b64encode(png).decode("ascii"),
+        bounds=bounds, name=f"Interpolated {field.upper().replace('_', '.')}",
+        pixelated=False, interactive=False, zindex=1,
+    ).add_to(m)
+    folium.LayerControl(collapsed=True).add_to(m)
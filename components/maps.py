@@ -0,0 +1,357 @@
+import hashlib
+import html
+import json
+import math
+import os
+import shutil
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+from components.heatmap import add_heat_layer
+from services.cache import SWRCache
+from services.metrics import metrics
+
+# ---------------- SHARED MAP HTML CACHE ----------------
+# The Home map depends only on the AQI snapshot and the station coordinates,
+# so its HTML is rendered once per (snapshot version, coordinates) and shared
+# by every session. Pages embed it as static HTML: a cache hit does not even
+# import folium, and panning or zooming never sends state back to the server.
+MAP_CACHE_MAX = int(os.getenv("MAP_CACHE_MAX", "8"))
+MAP_CENTER = (20.5937, 78.9629)
+MAP_ZOOM = 5
+
+# "markers" draws one circle per station; "cluster" ships stations as GeoJSON
+# grid tiles the browser loads for the visible area only and clusters
+# client-side. "auto" switches to clusters above MAP_CLUSTER_THRESHOLD.
+MAP_MODE = os.getenv("MAP_MODE", "auto")
+MAP_CLUSTER_THRESHOLD = int(os.getenv("MAP_CLUSTER_THRESHOLD", "100"))
+MAP_TILE_DEGREES = float(os.getenv("MAP_TILE_DEGREES", "2"))
+MAP_DETAIL_ZOOM = int(os.getenv("MAP_DETAIL_ZOOM", "7"))
+
+# With server.enableStaticServing, cluster tiles are written here and fetched
+# by the browser (Streamlit serves .json with its real content type).
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+TILE_DIR = STATIC_DIR / "map"
+TILE_URL = "app/static/map"
+
+MARKER_COLORS = {1: '#22c55e', 2: '#84cc16', 3: '#eab308', 4: '#f97316', 5: '#ef4444'}
+
+_maps = SWRCache("map_html", ttl=float("inf"), max_entries=MAP_CACHE_MAX, error_ttl=0)
+
+metrics.register_cache(_maps)
+
+
+def get_marker_color(aqi):
+    return MARKER_COLORS.get(aqi, '#94a3b8')
+
+
+def map_popup_html(city, data):
+    """Marker popup with the AQI and every reported pollutant, straight from the snapshot.
+
+    City and pollutant names come from the backend, so they are escaped.
+    """
+    rows = "".join(
+        f"<tr><td>{html.escape(name.upper().replace('_', '.'))}</td><td style='text-align: right; padding-left: 12px;'>{value:g}</td></tr>"
+        for name, value in data.pollutants.items()
+    )
+    return (
+        f"<div style='font-family: Inter, sans-serif; min-width: 150px;'>"
+        f"<b>{html.escape(city)}</b><br>AQI <b style='color: {get_marker_color(data.aqi)};'>{data.aqi}</b>"
+        f"<table style='margin-top: 6px; font-size: 12px;'>{rows}</table></div>"
+    )
+
+
+# ---------------- MARKERS MODE ----------------
+def _base_map():
+    import folium
+
+    return folium.Map(location=list(MAP_CENTER), zoom_start=MAP_ZOOM, tiles="CartoDB dark_matter", scrollWheelZoom=False)
+
+
+def _build_marker_map(snapshot, coords):
+    import folium
+
+    m = _base_map()
+    for city, data in (snapshot.items() if snapshot is not None else ()):
+        if data is None or city not in coords:
+            continue
+        folium.CircleMarker(
+            location=list(coords[city]), radius=12, color=get_marker_color(data.aqi), fill=True, fill_opacity=0.6,
+            popup=folium.Popup(map_popup_html(city, data), max_width=260),
+            tooltip=f"{html.escape(city)} • AQI {data.aqi}",
+        ).add_to(m)
+    add_heat_layer(m, snapshot, coords)
+    return m.get_root().render()
+
+
+# ---------------- CLUSTER MODE ----------------
+def station_tiles(snapshot, coords, cell=MAP_TILE_DEGREES):
+    """Split stations with a reading into ``cell``-degree grid tiles.
+
+    Returns ``(index, tiles)``: ``tiles`` maps ``"<x>_<y>"`` to a GeoJSON
+    FeatureCollection; ``index`` holds the cell size and, per tile, the
+    station count, centroid and mean AQI used for the zoomed-out overview.
+    """
+    features = {}
+    for city, data in snapshot.items():
+        if data is None or city not in coords:
+            continue
+        lat, lon = coords[city]
+        tile_id = f"{math.floor(lon / cell)}_{math.floor(lat / cell)}"
+        features.setdefault(tile_id, []).append({
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [round(lon, 4), round(lat, 4)]},
+            "properties": {"name": city, "aqi": data.aqi, "pollutants": dict(data.pollutants.items())},
+        })
+
+    summary = {}
+    for tile_id, items in features.items():
+        n = len(items)
+        summary[tile_id] = {
+            "count": n,
+            "lat": round(sum(f["geometry"]["coordinates"][1] for f in items) / n, 4),
+            "lon": round(sum(f["geometry"]["coordinates"][0] for f in items) / n, 4),
+            "aqi": round(sum(f["properties"]["aqi"] for f in items) / n),
+        }
+    tiles = {tile_id: {"type": "FeatureCollection", "features": items} for tile_id, items in features.items()}
+    return {"cell": cell, "tiles": summary}, tiles
+
+
+# Tile directories are shared by every worker process on the host: each one
+# that caches a page pointing at a directory leaves a ".pid-<pid>" marker in
+# it, and a directory is deleted only once no live process holds a marker.
+# Unmarked directories get MAP_TILE_GRACE seconds for their publisher to
+# claim them (and orphans of exited workers are swept after that).
+MAP_TILE_GRACE = int(os.getenv("MAP_TILE_GRACE", "300"))
+
+_tile_keys = {}  # tile directory name -> _maps key of the page using it
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _has_users(directory):
+    """True while a live process other than this one holds a marker in ``directory``."""
+    for marker in directory.glob(".pid-*"):
+        pid = int(marker.name[len(".pid-"):])
+        if pid == os.getpid():
+            continue
+        if _pid_alive(pid):
+            return True
+        marker.unlink(missing_ok=True)  # left behind by a worker that exited
+    return False
+
+
+def _remove_unused(directory):
+    if _has_users(directory):
+        return
+    # Move it out of the way first so a worker publishing the same version
+    # concurrently recreates it instead of writing into it.
+    doomed = TILE_DIR / f".{directory.name}-deleting-{os.getpid()}"
+    try:
+        directory.rename(doomed)
+    except OSError:
+        return
+    if _has_users(doomed):
+        doomed.rename(directory)
+    else:
+        shutil.rmtree(doomed, ignore_errors=True)
+
+
+def _release_tiles(current):
+    """Drop this process's claim on tile directories whose page ``_maps``
+    evicted, and remove directories no live process claims any more.
+    """
+    for name, key in list(_tile_keys.items()):
+        if name == current or _maps.peek(key) is not None:
+            continue
+        del _tile_keys[name]
+        (TILE_DIR / name / f".pid-{os.getpid()}").unlink(missing_ok=True)
+
+    cutoff = time.time() - MAP_TILE_GRACE
+    for directory in TILE_DIR.iterdir():
+        if directory.name.startswith(".") or directory.name in _tile_keys or not directory.is_dir():
+            continue
+        try:
+            if directory.stat().st_mtime > cutoff:
+                continue  # adding or removing a marker bumps this
+        except OSError:
+            continue
+        _remove_unused(directory)
+
+
+def _write_tiles(target, index, tiles):
+    # Stage the files, then rename into place so readers never see a partial set.
+    staging = TILE_DIR / f".{target.name}-{os.getpid()}"
+    staging.mkdir(parents=True, exist_ok=True)
+    for tile_id, collection in tiles.items():
+        (staging / f"{tile_id}.json").write_text(json.dumps(collection, separators=(",", ":")))
+    (staging / "index.json").write_text(json.dumps(index, separators=(",", ":")))
+    try:
+        staging.rename(target)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)  # another worker published it first
+
+
+def _publish_tiles(name, index, tiles, key):
+    """Write ``index``/``tiles`` to ``static/map/<name>/`` for the page cached
+    under ``key``; returns their URL prefix.
+    """
+    target = TILE_DIR / name
+    marker = target / f".pid-{os.getpid()}"
+    if not (target / "index.json").exists():
+        _write_tiles(target, index, tiles)
+    try:
+        marker.touch()
+    except OSError:
+        # Another worker's _remove_unused moved the directory away between
+        # the check and the touch: publish it again.
+        _write_tiles(target, index, tiles)
+        marker.touch()
+    _tile_keys[name] = key
+
+    _release_tiles(current=name)
+    return f"{TILE_URL}/{name}"
+
+
+@lru_cache(maxsize=None)
+def _viewport_layer():
+    # Defined lazily so importing this module does not import folium.
+    from branca.element import MacroElement
+    from folium.elements import JSCSSMixin
+    from folium.plugins import MarkerCluster
+    from folium.template import Template
+
+    class ViewportStations(JSCSSMixin, MacroElement):
+        """Loads the station tiles covering the viewport into a marker cluster."""
+
+        _template = Template("""
+{% macro script(this, kwargs) %}
+(function() {
+    var map = {{ this._parent.get_name() }};
+    var source = {{ this.source|tojson }};
+    var colors = {{ this.colors|tojson }};
+    var detailZoom = {{ this.detail_zoom }};
+    var clusters = L.markerClusterGroup({chunkedLoading: true});
+    var overview = L.layerGroup();
+    var loaded = {};
+    var index = null;
+
+    function load(name) {
+        if (source.inline) {
+            return Promise.resolve(name === "index" ? source.inline.index : source.inline.tiles[name]);
+        }
+        return fetch(source.url + "/" + name + ".json").then(function(r) { return r.json(); });
+    }
+    function color(aqi) { return Object.prototype.hasOwnProperty.call(colors, aqi) ? colors[aqi] : "#94a3b8"; }
+    // Station data is inserted into popup/tooltip HTML: escape it as text.
+    function esc(value) {
+        return String(value).replace(/[&<>"']/g, function(c) {
+            return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c];
+        });
+    }
+    function popup(p) {
+        var rows = Object.keys(p.pollutants).map(function(k) {
+            return "<tr><td>" + esc(k.toUpperCase().replace("_", ".")) + "</td><td style='text-align: right; padding-left: 12px;'>" + esc(p.pollutants[k]) + "</td></tr>";
+        }).join("");
+        return "<div style='font-family: Inter, sans-serif; min-width: 150px;'><b>" + esc(p.name) + "</b><br>AQI <b style='color: " + color(p.aqi) + ";'>" + esc(p.aqi) + "</b><table style='margin-top: 6px; font-size: 12px;'>" + rows + "</table></div>";
+    }
+    function addTile(collection) {
+        var layer = L.geoJSON(collection, {
+            pointToLayer: function(f, latlng) {
+                return L.circleMarker(latlng, {radius: 8, color: color(f.properties.aqi), fill: true, fillOpacity: 0.6});
+            },
+            onEachFeature: function(f, marker) {
+                marker.bindPopup(popup(f.properties), {maxWidth: 260});
+                marker.bindTooltip(esc(f.properties.name) + " • AQI " + esc(f.properties.aqi));
+            }
+        });
+        clusters.addLayers(layer.getLayers());
+    }
+    function refresh() {
+        if (!index) return;
+        if (map.getZoom() < detailZoom) {
+            map.removeLayer(clusters);
+            overview.addTo(map);
+            return;
+        }
+        map.removeLayer(overview);
+        clusters.addTo(map);
+        var b = map.getBounds(), cell = index.cell;
+        for (var x = Math.floor(b.getWest() / cell); x <= Math.floor(b.getEast() / cell); x++) {
+            for (var y = Math.floor(b.getSouth() / cell); y <= Math.floor(b.getNorth() / cell); y++) {
+                var id = x + "_" + y;
+                if (loaded[id] || !index.tiles[id]) continue;
+                loaded[id] = true;
+                load(id).then(addTile);
+            }
+        }
+    }
+    load("index").then(function(data) {
+        index = data;
+        Object.keys(index.tiles).forEach(function(id) {
+            var t = index.tiles[id];
+            L.circleMarker([t.lat, t.lon], {radius: Math.min(30, 6 + 2 * Math.sqrt(t.count)), color: color(t.aqi), fill: true, fillOpacity: 0.5})
+                .bindTooltip(t.count + " stations • mean AQI " + t.aqi)
+                .on("click", function(e) { map.setView(e.latlng, detailZoom); })
+                .addTo(overview);
+        });
+        refresh();
+    });
+    map.on("moveend", refresh);
+})();
+{% endmacro %}
+""")
+
+        default_js = MarkerCluster.default_js
+        default_css = MarkerCluster.default_css
+
+        def __init__(self, source, detail_zoom):
+            super().__init__()
+            self._name = "ViewportStations"
+            self.source = source
+            self.colors = MARKER_COLORS
+            self.detail_zoom = detail_zoom
+
+    return ViewportStations
+
+
+def _build_cluster_map(snapshot, coords, name, key):
+    m = _base_map()
+    add_heat_layer(m, snapshot, coords)
+    index, tiles = station_tiles(snapshot, coords)
+    if st.get_option("server.enableStaticServing"):
+        source = {"url": _publish_tiles(name, index, tiles, key)}
+    else:
+        # No static serving: inline the tiles; clustering still happens client-side.
+        source = {"inline": {"index": index, "tiles": tiles}}
+    _viewport_layer()(source, MAP_DETAIL_ZOOM).add_to(m)
+    return m.get_root().render()
+
+
+def map_mode(station_count):
+    if MAP_MODE in ("markers", "cluster"):
+        return MAP_MODE
+    return "cluster" if station_count > MAP_CLUSTER_THRESHOLD else "markers"
+
+
+def aqi_map_html(snapshot, coords, mode=None):
+    """Standalone HTML page of the AQI map for ``snapshot`` and ``{city: (lat, lon)}`` ``coords``."""
+    mode = mode or map_mode(len(coords))
+    if snapshot is None or not getattr(snapshot, "version", None):
+        return _build_marker_map(snapshot, coords)
+    key = (mode, snapshot.version, tuple(sorted((city, tuple(ll)) for city, ll in coords.items())))
+    if mode == "markers":
+        return _maps.get(key, lambda: _build_marker_map(snapshot, coords))
+    name = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+    return _maps.get(key, lambda: _build_cluster_map(snapshot, coords, name, key))
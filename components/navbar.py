@@ -0,0 +1,18 @@
+import streamlit as st
+
+
+def render_backend_status(status):
+    """Degraded-mode banner shown while any backend circuit breaker is open.
+
+    ``status`` is the dict returned by ``services.api_client.get_backend_status``.
+    """
+    if not status or not status.get("degraded"):
+        return
+
+    retry_in = [b["retry_in"] for b in status["breakers"].values() if b["retry_in"] is not None]
+    eta = f" Retrying in {int(min(retry_in))}s." if retry_in else ""
+    st.warning(
+        "Live data service is temporarily unreachable. "
+        f"Showing the most recent cached readings where available.{eta}",
+        icon="⚠️",
+    )
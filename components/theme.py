@@ -0,0 +1,23 @@
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+# Page stylesheets live in assets/css/<name>.css and are read once per server
+# process. Each page emits its sheet as one unchanging <style> element, so
+# the message hash is identical on every rerun; with
+# global.minCachedMessageSize lowered in .streamlit/config.toml, the browser
+# receives the CSS once per session and only a short hash reference after
+# that. (Streamlit's static file server sends .css as text/plain with
+# nosniff, so a <link> to /app/static would not be applied.)
+CSS_DIR = Path(__file__).resolve().parent.parent / "assets" / "css"
+
+
+@lru_cache(maxsize=None)
+def stylesheet(name):
+    """``<style>`` markup for ``assets/css/<name>.css``."""
+    return f"<style>\n{(CSS_DIR / f'{name}.css').read_text(encoding='utf-8')}</style>"
+
+
+def apply_theme(name):
+    st.markdown(stylesheet(name), unsafe_allow_html=True)
@@ -1,6 +1,25 @@
 import requests
 import logging
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timezone
+
+from urllib3.util import make_headers
+
+from services.cache import SWRCache
+from services.errors import (
+    BackendError,
+    BackendResponseError,
+    BackendUnavailableError,
+    CircuitOpenError,
+    NotFoundError,
+)
+from services.metrics import metrics
+from services.models import AQIHistory, AQISnapshot, CurrentAQI, StationStatus, parse_cities
+from services.resilience import CircuitBreaker, RetryPolicy
+from services.snapshot_store import open_snapshot_store
 
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
@@ -10,9 +29,64 @@ BASE_URL = os.getenv("BACKEND_BASE_URL", "https://skyguard-app.onrender.com")
 
 # ---------------- SESSION (PERFORMANCE) ----------------
 session = requests.Session()
+# Advertise every encoding urllib3 can decode here: gzip/deflate always,
+# br when Brotli is installed, zstd when zstandard is installed.
+session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+
+# ---------------- BATCH CONCURRENCY ----------------
+# Upper bound on simultaneous backend calls made by the batch helpers.
+MAX_CONCURRENCY = int(os.getenv("BACKEND_MAX_CONCURRENCY", "6"))
+
+# Pool for cache misses that pages resolve progressively. Sized on its own:
+# a slow miss holds a worker for the whole retry budget, and cache hits never
+# queue here (see ``cached_city_futures``).
+ASYNC_MAX_WORKERS = int(os.getenv("BACKEND_ASYNC_WORKERS", "16"))
+_executor = ThreadPoolExecutor(max_workers=ASYNC_MAX_WORKERS, thread_name_prefix="aqi-async")
+
+# ---------------- SHARED CACHE (PER ENDPOINT) ----------------
+CACHE_TTL_CITIES = int(os.getenv("CACHE_TTL_CITIES", "3600"))
+CACHE_TTL_CURRENT = int(os.getenv("CACHE_TTL_CURRENT", "300"))
+CACHE_TTL_HISTORY = int(os.getenv("CACHE_TTL_HISTORY", "600"))
+CACHE_MAX_CITIES = int(os.getenv("CACHE_MAX_CITIES", "512"))
+# Failures are cached too, but only briefly, so one blip doesn't blank a city.
+CACHE_ERROR_TTL = int(os.getenv("CACHE_ERROR_TTL", "15"))
+# The all-cities snapshot is rebuilt from the per-city cache, so a short TTL
+# is enough for every session in that window to share one object.
+CACHE_TTL_SNAPSHOT = int(os.getenv("CACHE_TTL_SNAPSHOT", "30"))
+# Station health: a reading older than these (seconds) is stale / offline.
+STATION_STALE_AFTER = int(os.getenv("STATION_STALE_AFTER", "7200"))
+STATION_OFFLINE_AFTER = int(os.getenv("STATION_OFFLINE_AFTER", "21600"))
+
+_cities_cache = SWRCache("cities", ttl=CACHE_TTL_CITIES, max_entries=1, error_ttl=CACHE_ERROR_TTL)
+_current_cache = SWRCache("current", ttl=CACHE_TTL_CURRENT, max_entries=CACHE_MAX_CITIES, error_ttl=CACHE_ERROR_TTL)
+_history_cache = SWRCache("history", ttl=CACHE_TTL_HISTORY, max_entries=CACHE_MAX_CITIES, error_ttl=CACHE_ERROR_TTL)
+_snapshot_cache = SWRCache("aqi_snapshot", ttl=CACHE_TTL_SNAPSHOT, max_entries=1, error_ttl=CACHE_ERROR_TTL)
+_status_cache = SWRCache("station_status", ttl=CACHE_TTL_SNAPSHOT, max_entries=1, error_ttl=CACHE_ERROR_TTL)
+_caches = {
+    "cities": _cities_cache, "current": _current_cache, "history": _history_cache,
+    "aqi_snapshot": _snapshot_cache, "station_status": _status_cache,
+}
+
+for _cache in _caches.values():
+    metrics.register_cache(_cache)
+
+# ---------------- LAST-KNOWN-GOOD SNAPSHOTS (DISK) ----------------
+_snapshots = open_snapshot_store()
+
+
+# ---------------- RETRY / CIRCUIT BREAKER ----------------
+RETRY_POLICY = RetryPolicy(
+    retries=int(os.getenv("BACKEND_RETRIES", "2")),
+    backoff_base=float(os.getenv("BACKEND_BACKOFF_BASE", "0.5")),
+    backoff_max=float(os.getenv("BACKEND_BACKOFF_MAX", "8")),
+)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "3"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("BREAKER_RESET_TIMEOUT", "30"))
 
 
 def check_backend_health():
+    # Deliberately bypasses retries and breakers: it is the breakers' probe.
     try:
         response = session.get(f"{BASE_URL}/health/", timeout=5)
         return response.json() if response.status_code == 200 else None
@@ -21,15 +95,181 @@ def check_backend_health():
         return None
 
 
-def get_current_aqi(city="Ahmedabad"):
+_breakers = {
+    path: CircuitBreaker(
+        path,
+        failure_threshold=BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=BREAKER_RESET_TIMEOUT,
+        probe=check_backend_health,
+    )
+    for path in ("/cities", "/aqi/current", "/aqi/last-24-hours")
+}
+
+
+def _get(path, params=None, timeout=5, headers=None):
+    """GET ``path`` with retries, backoff and the endpoint's circuit breaker.
+
+    Connection errors, timeouts and ``RETRY_STATUSES`` are retried; any other
+    response (including 304 and 4xx) is returned to the caller untouched.
+    Every call is timed into the ``backend_request_seconds`` histogram.
+    """
+    breaker = _breakers[path]
+    if not breaker.allow():
+        metrics.inc("backend_requests_total", endpoint=path, outcome="circuit_open")
+        raise CircuitOpenError(f"Circuit open for {path}")
+
+    started = time.perf_counter()
+    outcome = "error"
+    delays = RETRY_POLICY.delays()
     try:
-        response = session.get(
-            f"{BASE_URL}/aqi/current",
-            params={"city": city},
-            timeout=5
-        )
-        return response.json() if response.status_code == 200 else None
+        while True:
+            try:
+                response = session.get(f"{BASE_URL}{path}", params=params, timeout=timeout, headers=headers)
+                if response.status_code in RETRY_STATUSES:
+                    raise requests.exceptions.HTTPError(
+                        f"{response.status_code} from {path}", response=response
+                    )
+                breaker.record_success()
+                outcome = str(response.status_code)
+                return response
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                    requests.exceptions.HTTPError) as e:
+                delay = next(delays, None)
+                if delay is None:
+                    breaker.record_failure()
+                    raise
+                metrics.inc("backend_retries_total", endpoint=path)
+                logger.warning(f"Retrying {path} in {delay:.2f}s after: {e}")
+                time.sleep(delay)
+            except requests.exceptions.RequestException:
+                breaker.record_failure()
+                raise
+    finally:
+        metrics.observe("backend_request_seconds", time.perf_counter() - started, endpoint=path)
+        metrics.inc("backend_requests_total", endpoint=path, outcome=outcome)
+
+
+def get_backend_status():
+    """Breaker state per endpoint; ``degraded`` is True while any circuit is not closed."""
+    breakers = {path: breaker.snapshot() for path, breaker in _breakers.items()}
+    return {
+        "degraded": any(b["state"] != CircuitBreaker.CLOSED for b in breakers.values()),
+        "breakers": breakers,
+    }
+
+
+def _get_json(path, params=None, timeout=5, headers=None):
+    """``_get`` plus status/body checks, translated into ``services.errors`` types.
+
+    Returns ``(response, payload)``; ``payload`` is ``None`` for a 304.
+    """
+    try:
+        response = _get(path, params=params, timeout=timeout, headers=headers)
     except requests.exceptions.RequestException as e:
+        raise BackendUnavailableError(f"{path}: {e}") from e
+
+    if response.status_code == 304:
+        return response, None
+    if response.status_code == 404:
+        raise NotFoundError(f"{path} not found for {params}")
+    if response.status_code != 200:
+        raise BackendResponseError(
+            f"{path} returned HTTP {response.status_code}", status_code=response.status_code
+        )
+    try:
+        return response, response.json()
+    except ValueError as e:
+        raise BackendResponseError(f"{path} returned invalid JSON: {e}", status_code=200) from e
+
+
+def _fetch(kind, key, path, parse, params=None, timeout=5):
+    """Conditional GET backed by the shared cache, parsed into a model.
+
+    Sends the ``ETag`` / ``Last-Modified`` validators stored with the cached
+    value for ``(kind, key)``; on ``304 Not Modified`` that model is reused
+    without downloading or parsing anything. The raw payload is what goes
+    into the snapshot store.
+
+    Returns ``(value, meta)`` and never writes the cache itself: callers that
+    cache store both in one ``SWRCache.set``, so a new ETag is never recorded
+    next to an old body.
+    """
+    cache = _caches[kind]
+    cached_value, validators = cache.peek(key, with_meta=True)
+    if cached_value is None:
+        validators = None
+
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    started = time.perf_counter()
+    try:
+        response, payload = _get_json(path, params=params, timeout=timeout, headers=headers or None)
+        latency = time.perf_counter() - started
+        if payload is None:
+            if cached_value is None:
+                raise BackendResponseError(f"{path} returned 304 without a cached body", status_code=304)
+            _snapshots.touch(kind, key)
+            return cached_value, {**(validators or {}), "latency": latency}
+        value = parse(payload, key)
+    except BackendError as e:
+        metrics.inc("backend_errors_total", endpoint=path, kind=type(e).__name__)
+        raise
+
+    _snapshots.save(kind, key, payload)
+    return value, {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "latency": latency,
+    }
+
+
+_parsers = {
+    "cities": lambda payload, key: parse_cities(payload),
+    "current": CurrentAQI.from_dict,
+    "history": AQIHistory.from_rows,
+}
+
+
+# ---------------- LOADERS ((value, meta) FOR THE CACHE) ----------------
+def _load_current(city):
+    return _fetch("current", city, "/aqi/current", _parsers["current"], params={"city": city}, timeout=5)
+
+
+def _load_cities(key="cities"):
+    return _fetch("cities", "cities", "/cities", _parsers["cities"], timeout=5)
+
+
+def _load_history(city):
+    return _fetch("history", city, "/aqi/last-24-hours", _parsers["history"], params={"city": city}, timeout=10)
+
+
+# ---------------- TYPED FETCHERS (RAISE BackendError) ----------------
+def fetch_current_aqi(city):
+    """Current reading for ``city`` as a ``CurrentAQI``."""
+    return _load_current(city)[0]
+
+
+def fetch_cities():
+    """Tuple of monitored city names."""
+    return _load_cities()[0]
+
+
+def fetch_last_24_hours_aqi(city):
+    """Last 24 hours for ``city`` as a column-wise ``AQIHistory``."""
+    return _load_history(city)[0]
+
+
+# ---------------- LEGACY FETCHERS (RETURN None / []) ----------------
+def get_current_aqi(city="Ahmedabad"):
+    try:
+        return fetch_current_aqi(city)
+    except BackendError as e:
         logger.error(f"Current AQI fetch failed for {city}: {e}")
         return None
 
@@ -37,10 +277,8 @@ def get_current_aqi(city="Ahmedabad"):
 def get_cities():
     """Fetch list of city names."""
     try:
-        response = session.get(f"{BASE_URL}/cities", timeout=5)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return fetch_cities()
+    except BackendError as e:
         logger.error(f"Failed to fetch cities: {e}")
         return []
 
@@ -48,13 +286,244 @@ def get_cities():
 def get_last_24_hours_aqi(city):
     """Fetch last 24 hours AQI data for a city."""
     try:
-        response = session.get(
-            f"{BASE_URL}/aqi/last-24-hours",
-            params={"city": city},
-            timeout=10
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return fetch_last_24_hours_aqi(city)
+    except BackendError as e:
+        logger.error(f"24h history fetch failed for {city}: {e}")
+        return []
+
+
+def _fetch_many(fetch, cities, max_workers=None, default=None):
+    """Run ``fetch(city)`` for every city on a bounded thread pool.
+
+    Each city is isolated: an exception for one city is logged and stored
+    as ``default`` without affecting the others.
+    """
+    cities = list(dict.fromkeys(cities))
+    if not cities:
+        return {}
+
+    workers = max(1, min(max_workers or MAX_CONCURRENCY, len(cities)))
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aqi-batch") as pool:
+        futures = {city: pool.submit(fetch, city) for city in cities}
+        for city, future in futures.items():
+            try:
+                results[city] = future.result()
+            except Exception as e:
+                logger.error(f"Batch fetch failed for {city}: {e}")
+                results[city] = default
+    return results
+
+
+def get_current_aqi_batch(cities, max_workers=None):
+    """Fetch current AQI for many cities concurrently.
+
+    Returns a dict of city -> ``CurrentAQI`` (``None`` for cities that failed).
+    """
+    return _fetch_many(get_current_aqi, cities, max_workers=max_workers, default=None)
+
+
+def get_last_24_hours_aqi_batch(cities, max_workers=None):
+    """Fetch 24-hour history for many cities concurrently.
+
+    Returns a dict of city -> ``AQIHistory`` (``[]`` for cities that failed).
+    """
+    return _fetch_many(get_last_24_hours_aqi, cities, max_workers=max_workers, default=[])
+
+
+# ---------------- CACHED ACCESSORS (USED BY PAGES) ----------------
+def cached_cities():
+    try:
+        return _cities_cache.get("cities", _load_cities, with_meta=True)
+    except BackendError as e:
+        logger.error(f"Failed to fetch cities: {e}")
+        return []
+
+
+def cached_current_aqi(city):
+    try:
+        return _current_cache.get(city, lambda: _load_current(city), with_meta=True)
+    except BackendError as e:
+        logger.error(f"Current AQI fetch failed for {city}: {e}")
+        return None
+
+
+def cached_last_24_hours(city):
+    try:
+        return _history_cache.get(city, lambda: _load_history(city), with_meta=True)
+    except BackendError as e:
         logger.error(f"24h history fetch failed for {city}: {e}")
         return []
+
+
+def get_data_age(kind, key="cities"):
+    """Seconds since the cached ``kind`` ("cities", "current", "history") data for
+    ``key`` was fetched, or ``None`` if nothing is cached. Snapshots restored from
+    disk keep their original fetch time, so this is their real age.
+    """
+    return _caches[kind].age(key)
+
+
+def cached_current_aqi_batch(cities, max_workers=None):
+    """Cached variant of ``get_current_aqi_batch``; only misses hit the backend."""
+    return _fetch_many(cached_current_aqi, cities, max_workers=max_workers, default=None)
+
+
+def cached_aqi_snapshot(max_workers=None):
+    """Current readings for every city as one shared ``AQISnapshot``.
+
+    Misses are fetched concurrently; all sessions within ``CACHE_TTL_SNAPSHOT``
+    get the same object (and ``version``), so derived views can be cached on it.
+    """
+    def load():
+        return AQISnapshot.from_readings(cached_current_aqi_batch(cached_cities(), max_workers=max_workers))
+
+    try:
+        return _snapshot_cache.get("all", load)
+    except Exception as e:
+        logger.error(f"AQI snapshot unavailable: {e}")
+        return AQISnapshot.from_readings({})
+
+
+def check_station_status(snapshot, now=None):
+    """Batch freshness check: ``{city: StationStatus}`` for every city in ``snapshot``.
+
+    A station is offline without a reading or when its reading is older than
+    ``STATION_OFFLINE_AFTER``; stale when older than ``STATION_STALE_AFTER``
+    or when its last fetch failed (the snapshot then holds an older reading).
+    """
+    now = time.time() if now is None else now
+    statuses = {}
+    for city, reading in snapshot.items():
+        failed = _current_cache.error(city)
+        latency = (_current_cache.meta(city) or {}).get("latency")
+        age = None
+        if reading is not None and reading.recorded_at is not None:
+            recorded_at = reading.recorded_at
+            if recorded_at.tzinfo is None:
+                recorded_at = recorded_at.replace(tzinfo=timezone.utc)
+            age = max(0.0, now - recorded_at.timestamp())
+
+        if reading is None or (age is not None and age > STATION_OFFLINE_AFTER):
+            state = "offline"
+        elif failed is not None or (age is not None and age > STATION_STALE_AFTER):
+            state = "stale"
+        else:
+            state = "online"
+        statuses[city] = StationStatus(
+            city=city, state=state, age=age, latency=latency,
+            error=str(failed[0]) if failed is not None else None,
+        )
+    return statuses
+
+
+def cached_station_status():
+    """``check_station_status`` over the shared snapshot, run once per
+    ``CACHE_TTL_SNAPSHOT`` for all stations and sessions.
+    """
+    try:
+        return _status_cache.get("all", lambda: check_station_status(cached_aqi_snapshot()))
+    except Exception as e:
+        logger.error(f"Station status unavailable: {e}")
+        return {}
+
+
+# In-flight misses by (cache name, key): a page that reruns while a load is
+# still running picks up the same future instead of queueing another task.
+_pending = {}
+_pending_lock = threading.Lock()
+
+
+def _cached_future(cache, read, key):
+    # Anything already cached (fresh or stale) is read inline, so hits never
+    # wait behind other sessions' misses on the shared pool.
+    if cache.peek(key) is None:
+        pending_key = (cache.name, key)
+        with _pending_lock:
+            future = _pending.get(pending_key)
+            if future is None:
+                future = _pending[pending_key] = _executor.submit(read, key)
+                future.add_done_callback(lambda _: _forget_pending(pending_key))
+        return future
+    future = Future()
+    try:
+        future.set_result(read(key))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _forget_pending(pending_key):
+    with _pending_lock:
+        _pending.pop(pending_key, None)
+
+
+def cached_city_futures(city):
+    """Start the cached current and 24h reads for ``city`` in parallel.
+
+    Returns ``(current_future, history_future)`` so a page can render each
+    section as soon as its own data is ready. Cache hits come back already
+    resolved; only misses are sent to the pool, once per key while in flight.
+    """
+    return (_cached_future(_current_cache, cached_current_aqi, city),
+            _cached_future(_history_cache, cached_last_24_hours, city))
+
+
+def is_warm():
+    """True once the city list and a current reading for every city are cached.
+
+    Stale entries count: they render immediately and refresh in the background.
+    """
+    cities = _cities_cache.peek("cities")
+    return bool(cities) and all(_current_cache.peek(city) is not None for city in cities)
+
+
+def submit(fn, *args, **kwargs):
+    """Run ``fn`` on the shared client pool; returns a ``Future``."""
+    return _executor.submit(fn, *args, **kwargs)
+
+
+# ---------------- CACHE FILL (USED BY THE PREFETCHER) ----------------
+def _refresh_into(cache, load, key):
+    try:
+        value, meta = load(key)
+        cache.set(key, value, meta=meta)
+    except BackendError as e:
+        logger.error(f"Prefetch of {cache.name}:{key} failed: {e}")
+        cache.set_error(key, e)
+
+
+def refresh_all(max_workers=None):
+    """Fetch cities, current AQI and 24h history and store them in the shared cache.
+
+    Failures are recorded as short-lived errors and never replace data
+    already cached. Returns the list of cities that were refreshed.
+    """
+    _refresh_into(_cities_cache, _load_cities, "cities")
+    cities = _cities_cache.peek("cities") or []
+
+    _fetch_many(lambda city: _refresh_into(_current_cache, _load_current, city),
+                cities, max_workers=max_workers)
+    _fetch_many(lambda city: _refresh_into(_history_cache, _load_history, city),
+                cities, max_workers=max_workers)
+    return cities
+
+
+# ---------------- COLD START ----------------
+def _warm_from_snapshots():
+    """Seed the caches from disk so the first render doesn't wait on the backend.
+
+    Entries keep their original fetch time, so anything older than its TTL is
+    served as stale and refreshed in the background on first read.
+    """
+    for kind, key, payload, fetched_at in _snapshots.load_all():
+        cache = _caches.get(kind)
+        if cache is None or cache.peek(key) is not None:
+            continue
+        try:
+            cache.set(key, _parsers[kind](payload, key), stored_at=fetched_at)
+        except BackendError as e:
+            logger.error(f"Ignoring unreadable snapshot {kind}:{key}: {e}")
+
+
+_warm_from_snapshots()
@@ -0,0 +1,239 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ("value", "stored_at", "has_value", "error", "error_at", "meta")
+
+    def __init__(self):
+        self.value = None
+        self.stored_at = None
+        self.has_value = False
+        self.error = None
+        self.error_at = None
+        self.meta = None
+
+
+class SWRCache:
+    """Process-wide LRU cache with stale-while-revalidate reads.
+
+    Fresh entries (younger than ``ttl``) are returned as-is. Expired entries
+    are still returned immediately while a background thread reloads them,
+    so only a true miss ever blocks the caller. ``max_stale`` caps how long
+    past ``ttl`` an entry may be served (``None`` means no cap).
+
+    Failed loads are cached for ``error_ttl`` seconds only: a key that has
+    never loaded re-raises the stored error until it expires, while a key
+    with good data keeps serving that data and is not reloaded again until
+    the error expires. A failure never evicts or overwrites a good value.
+    """
+
+    def __init__(self, name, ttl, max_entries=128, max_stale=None, error_ttl=15):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_stale = max_stale
+        self.error_ttl = error_ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # key -> [lock, holders]; an entry lives only while a load is in flight.
+        self._key_locks = {}
+        self._refreshing = set()
+        self._stats = {"hit": 0, "stale": 0, "miss": 0, "error": 0}
+
+    # ---------------- READS ----------------
+    def get(self, key, loader, with_meta=False):
+        """Return the value for ``key``, calling ``loader()`` only on a miss.
+
+        With ``with_meta``, ``loader()`` returns ``(value, meta)`` and both are
+        stored together (see ``set``). Raises the loader's exception when there
+        is no good value to fall back on.
+        """
+        with self._lock:
+            hit = self._lookup(key, time.time())
+            if hit is not None:
+                self._count(hit[0])
+                if hit[0] == "stale":
+                    self._schedule_refresh(key, loader, with_meta)
+                return self._resolve(hit)
+
+        # True miss: load once per key even if several sessions arrive together.
+        with self._key_lock(key):
+            with self._lock:
+                hit = self._lookup(key, time.time())
+                if hit is not None and hit[0] != "stale":
+                    self._count(hit[0])
+                    return self._resolve(hit)
+                self._stats["miss"] += 1
+            try:
+                value, meta = loader() if with_meta else (loader(), None)
+            except Exception as e:
+                self.set_error(key, e)
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry is not None and entry.has_value:
+                        return entry.value
+                raise
+            self.set(key, value, meta=meta)
+            return value
+
+    def peek(self, key, with_meta=False):
+        """Return the last good value for ``key`` (fresh or stale) without loading.
+
+        With ``with_meta``, returns ``(value, meta)`` read under one lock, so
+        the metadata always belongs to that value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if with_meta:
+                return (entry.value, entry.meta) if entry is not None else (None, None)
+            return entry.value if entry is not None else None
+
+    def age(self, key):
+        """Seconds since ``key`` last loaded successfully, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.has_value:
+                return None
+            return time.time() - entry.stored_at
+
+    def error(self, key):
+        """``(exception, failed_at)`` for the last failed load of ``key``, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.error is None:
+                return None
+            return entry.error, entry.error_at
+
+    def meta(self, key):
+        """Metadata recorded for ``key`` (e.g. HTTP validators), or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.meta if entry is not None else None
+
+    def stats(self):
+        """Read counters: ``hit`` (fresh or held), ``stale``, ``miss`` and cached ``error``."""
+        with self._lock:
+            return dict(self._stats)
+
+    # ---------------- WRITES ----------------
+    def set(self, key, value, stored_at=None, meta=None):
+        """Store ``value`` and its ``meta`` (e.g. HTTP validators) in one write.
+
+        Metadata is replaced with the value, never on its own, so validators
+        cannot outlive the body they describe.
+        """
+        with self._lock:
+            entry = self._entry(key)
+            entry.value = value
+            entry.has_value = True
+            entry.stored_at = stored_at if stored_at is not None else time.time()
+            entry.meta = meta
+            entry.error = None
+            entry.error_at = None
+
+    def set_error(self, key, error):
+        """Record a failed load without touching any good value already stored."""
+        with self._lock:
+            entry = self._entry(key)
+            entry.error = error
+            entry.error_at = time.time()
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    # ---------------- INTERNALS ----------------
+    def _lookup(self, key, now):
+        # Called with self._lock held. Returns None on a miss, otherwise
+        # ("fresh" | "stale" | "held", value) or ("error", exception).
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        error_fresh = entry.error is not None and now - entry.error_at < self.error_ttl
+        if entry.has_value:
+            age = now - entry.stored_at
+            if age < self.ttl:
+                return ("fresh", entry.value)
+            if error_fresh:
+                return ("held", entry.value)
+            if self.max_stale is None or age < self.ttl + self.max_stale:
+                return ("stale", entry.value)
+            return None
+        if error_fresh:
+            return ("error", entry.error)
+        return None
+
+    def _count(self, kind):
+        # Called with self._lock held.
+        self._stats["stale" if kind == "stale" else "error" if kind == "error" else "hit"] += 1
+
+    @staticmethod
+    def _resolve(hit):
+        if hit[0] == "error":
+            raise hit[1]
+        return hit[1]
+
+    def _entry(self, key):
+        # Called with self._lock held.
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry()
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    @contextmanager
+    def _key_lock(self, key):
+        # Reference-counted so the lock (and the key it holds) is dropped as
+        # soon as the last waiting loader finishes.
+        with self._lock:
+            slot = self._key_locks.get(key)
+            if slot is None:
+                slot = self._key_locks[key] = [threading.Lock(), 0]
+            slot[1] += 1
+        try:
+            with slot[0]:
+                yield
+        finally:
+            with self._lock:
+                slot[1] -= 1
+                if slot[1] == 0:
+                    del self._key_locks[key]
+
+    def _schedule_refresh(self, key, loader, with_meta):
+        # Called with self._lock held.
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        threading.Thread(
+            target=self._refresh,
+            args=(key, loader, with_meta),
+            name=f"{self.name}-refresh",
+            daemon=True,
+        ).start()
+
+    def _refresh(self, key, loader, with_meta):
+        try:
+            value, meta = loader() if with_meta else (loader(), None)
+            self.set(key, value, meta=meta)
+        except Exception as e:
+            logger.error(f"Background refresh failed for {self.name}:{key}: {e}")
+            self.set_error(key, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
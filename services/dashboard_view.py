@@ -0,0 +1,88 @@
+import os
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from services.cache import SWRCache
+from services.metrics import metrics
+from utils.helpers import format_reading, format_timestamp, get_aqi_theme, get_safety_advice
+
+# (label, pollutant, unit) for the Dashboard's "Live Pollutant Breakdown" metrics.
+READINGS = (
+    ("PM2.5", "pm2_5", "µg/m³"),
+    ("PM10", "pm10", "µg/m³"),
+    ("Nitrogen Dioxide", "no2", "µg/m³"),
+    ("Carbon Monoxide", "co", "mg/m³"),
+)
+
+
+@dataclass(frozen=True)
+class DashboardView:
+    """Everything the Dashboard's header and metric sections render for one
+    city at one current reading.
+
+    Built once per (city, current ``recorded_at``) and shared read-only by
+    every session showing that reading. It depends on the current reading
+    only, so the header never waits for the 24h history; the history-driven
+    charts are cached separately per data version in ``components.charts``.
+    """
+
+    __slots__ = ("city", "current", "theme", "safety", "synced_at", "readings")
+
+    city: str
+    current: object      # CurrentAQI
+    theme: MappingProxyType
+    safety: MappingProxyType
+    synced_at: str
+    readings: tuple      # ((label, formatted value), ...)
+
+    @classmethod
+    def build(cls, city, current):
+        return cls(
+            city=city,
+            current=current,
+            theme=MappingProxyType(get_aqi_theme(current.aqi)),
+            safety=MappingProxyType(get_safety_advice(current.aqi)),
+            synced_at=format_timestamp(current.recorded_at),
+            readings=tuple(
+                (label, format_reading(current.pollutants[name], unit))
+                for label, name, unit in READINGS
+            ),
+        )
+
+    @property
+    def key(self):
+        return view_key(self.city, self.current)
+
+
+def view_key(city, current):
+    """``(city, current recorded_at)``: the data version."""
+    return (city, current.recorded_at)
+
+
+# ---------------- SHARED VIEW STORE ----------------
+# The only place views are kept: sessions hold just a key, so VIEW_CACHE_MAX
+# bounds the memory spent on views however many sessions there are, and an
+# evicted version is not kept alive by a session that last rendered it.
+# Entries older than VIEW_CACHE_TTL are rebuilt instead of reused.
+VIEW_CACHE_MAX = int(os.getenv("VIEW_CACHE_MAX", "256"))
+VIEW_CACHE_TTL = int(os.getenv("VIEW_CACHE_TTL", "7200"))
+
+_views = SWRCache("dashboard_views", ttl=VIEW_CACHE_TTL, max_entries=VIEW_CACHE_MAX, max_stale=0, error_ttl=0)
+
+metrics.register_cache(_views)
+
+
+def load_dashboard_view(city, current):
+    """The shared ``DashboardView`` for this reading, or ``None`` without one."""
+    if current is None:
+        return None
+    key = view_key(city, current)
+    if key[1] is None:
+        # Unversioned data cannot be shared safely between sessions.
+        return DashboardView.build(city, current)
+    return _views.get(key, lambda: DashboardView.build(city, current))
+
+
+def peek_dashboard_view(key):
+    """The shared view stored under ``key`` (see ``DashboardView.key``), or ``None`` once evicted."""
+    return _views.peek(key)
@@ -0,0 +1,26 @@
+class BackendError(Exception):
+    """Base class for every failure raised by ``services.api_client``."""
+
+
+class BackendUnavailableError(BackendError):
+    """The backend could not be reached (connection error, timeout, 5xx after retries)."""
+
+
+class CircuitOpenError(BackendUnavailableError):
+    """Raised instead of calling the backend while an endpoint's circuit is open."""
+
+
+class NotFoundError(BackendError):
+    """The backend answered 404, e.g. for an unknown city."""
+
+
+class BackendResponseError(BackendError):
+    """The backend answered with an unexpected status or an unreadable body."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class SchemaError(BackendResponseError):
+    """The backend answered 200 but the payload doesn't match the expected schema."""
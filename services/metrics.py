@@ -0,0 +1,142 @@
+import bisect
+import math
+import threading
+from collections import deque
+
+# Prometheus-style latency buckets, in seconds.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _label_text(labels):
+    if not labels:
+        return ""
+    parts = ",".join(f'{k}="{str(v)}"' for k, v in sorted(labels.items()))
+    return "{" + parts + "}"
+
+
+class Histogram:
+    """Cumulative buckets for Prometheus plus a bounded sample window for percentiles."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS, window=1024):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._samples = deque(maxlen=window)
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self._samples.append(value)
+
+    def percentile(self, q):
+        """Nearest-rank percentile (``q`` in 0-100) over the recent sample window."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+
+class MetricsRegistry:
+    """In-process counters and latency histograms keyed by name and labels.
+
+    ``register_collector(fn)`` adds a callable returning extra
+    ``(name, labels, value)`` counter samples at read time;
+    ``register_cache(cache)`` uses it to expose cache statistics without the
+    cache knowing about metrics.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._collectors = []
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def register_collector(self, collector):
+        self._collectors.append(collector)
+
+    def register_cache(self, cache):
+        """Expose ``cache.stats()`` as ``cache_requests_total{cache=cache.name}``."""
+        self.register_collector(lambda: [
+            ("cache_requests_total", {"cache": cache.name, "result": result}, count)
+            for result, count in cache.stats().items()
+        ])
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    # ---------------- READS ----------------
+    def counters(self):
+        with self._lock:
+            samples = [(name, dict(labels), value) for (name, labels), value in self._counters.items()]
+        for collector in self._collectors:
+            samples.extend(collector())
+        return samples
+
+    def latency_summary(self, name):
+        """Per-label-set ``count``/``mean``/``p50``/``p95``/``p99`` (seconds) for histogram ``name``."""
+        with self._lock:
+            rows = []
+            for (hist_name, labels), h in self._histograms.items():
+                if hist_name != name:
+                    continue
+                rows.append({
+                    **dict(labels),
+                    "count": h.count,
+                    "mean": h.sum / h.count if h.count else None,
+                    "p50": h.percentile(50),
+                    "p95": h.percentile(95),
+                    "p99": h.percentile(99),
+                })
+            return rows
+
+    def render_prometheus(self):
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        by_name = {}
+        for name, labels, value in self.counters():
+            by_name.setdefault(name, []).append((labels, value))
+        for name in sorted(by_name):
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in by_name[name]:
+                lines.append(f"{name}{_label_text(labels)} {value}")
+
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            seen = set()
+            for (name, labels), h in histograms:
+                labels = dict(labels)
+                if name not in seen:
+                    lines.append(f"# TYPE {name} histogram")
+                    seen.add(name)
+                cumulative = 0
+                for bound, count in zip(h.buckets, h.bucket_counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_label_text({**labels, 'le': bound})} {cumulative}")
+                lines.append(f"{name}_bucket{_label_text({**labels, 'le': '+Inf'})} {h.count}")
+                lines.append(f"{name}_sum{_label_text(labels)} {h.sum}")
+                lines.append(f"{name}_count{_label_text(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry shared by every session.
+metrics = MetricsRegistry()
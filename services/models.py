@@ -0,0 +1,217 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+
+from services.errors import SchemaError
+
+POLLUTANT_FIELDS = ("pm2_5", "pm10", "co", "no2", "so2", "o3", "nh3")
+
+
+def parse_timestamp(value):
+    """ISO-8601 string (``Z`` suffix allowed) -> ``datetime``; ``None`` stays ``None``."""
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError as e:
+        raise SchemaError(f"Invalid timestamp {value!r}") from e
+
+
+def _number(value, field, cast=float):
+    if value is None:
+        return None
+    try:
+        return cast(value)
+    except (TypeError, ValueError) as e:
+        raise SchemaError(f"Field {field!r} is not numeric: {value!r}") from e
+
+
+# Frozen dataclasses with explicit __slots__ (no per-instance __dict__). They
+# are parsed once in the API client and shared read-only across sessions.
+
+@dataclass(frozen=True)
+class PollutantSet:
+    __slots__ = POLLUTANT_FIELDS
+
+    pm2_5: float
+    pm10: float
+    co: float
+    no2: float
+    so2: float
+    o3: float
+    nh3: float
+
+    @classmethod
+    def from_dict(cls, raw):
+        if not isinstance(raw, dict):
+            raise SchemaError(f"Expected pollutant object, got {type(raw).__name__}")
+        return cls(*(_number(raw.get(name), name) for name in POLLUTANT_FIELDS))
+
+    def items(self):
+        """``(name, value)`` pairs for the pollutants that were reported."""
+        return [(name, getattr(self, name)) for name in POLLUTANT_FIELDS if getattr(self, name) is not None]
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+
+@dataclass(frozen=True)
+class CurrentAQI:
+    __slots__ = ("city", "aqi", "pollutants", "recorded_at")
+
+    city: str
+    aqi: int
+    pollutants: PollutantSet
+    recorded_at: datetime
+
+    @classmethod
+    def from_dict(cls, raw, city=None):
+        if not isinstance(raw, dict):
+            raise SchemaError(f"Expected current AQI object, got {type(raw).__name__}")
+        if raw.get("aqi") is None:
+            raise SchemaError("Current AQI payload has no 'aqi'")
+        return cls(
+            city=raw.get("city") or city,
+            aqi=_number(raw["aqi"], "aqi", int),
+            pollutants=PollutantSet.from_dict(raw.get("pollutants") or {}),
+            recorded_at=parse_timestamp(raw.get("recorded_at")),
+        )
+
+
+@dataclass(frozen=True)
+class HourlyPoint:
+    __slots__ = ("recorded_at", "aqi", "pollutants")
+
+    recorded_at: datetime
+    aqi: int
+    pollutants: PollutantSet
+
+
+@dataclass(frozen=True)
+class AQIHistory:
+    """24-hour history stored column-wise (one tuple per field) instead of a list of dicts.
+
+    ``pollutants`` maps each pollutant reported in at least one row to its
+    column; missing readings are ``None``.
+    """
+
+    __slots__ = ("city", "recorded_at", "aqi", "pollutants")
+
+    city: str
+    recorded_at: tuple
+    aqi: tuple
+    pollutants: dict
+
+    @classmethod
+    def from_rows(cls, rows, city=None):
+        if not isinstance(rows, list):
+            raise SchemaError(f"Expected list of hourly rows, got {type(rows).__name__}")
+
+        recorded_at, aqi = [], []
+        columns = {name: [] for name in POLLUTANT_FIELDS}
+        for row in rows:
+            if not isinstance(row, dict) or "recorded_at" not in row:
+                raise SchemaError(f"Invalid hourly row: {row!r}")
+            # Rows may carry pollutants flat or nested under "pollutants".
+            values = row.get("pollutants") if isinstance(row.get("pollutants"), dict) else row
+            recorded_at.append(parse_timestamp(row["recorded_at"]))
+            aqi.append(_number(row.get("aqi"), "aqi", int))
+            for name in POLLUTANT_FIELDS:
+                columns[name].append(_number(values.get(name), name))
+
+        return cls(
+            city=city,
+            recorded_at=tuple(recorded_at),
+            aqi=tuple(aqi),
+            pollutants={
+                name: tuple(col) for name, col in columns.items()
+                if any(v is not None for v in col)
+            },
+        )
+
+    def __len__(self):
+        return len(self.recorded_at)
+
+    @property
+    def latest_recorded_at(self):
+        return max((ts for ts in self.recorded_at if ts is not None), default=None)
+
+    def points(self):
+        """Iterate rows as ``HourlyPoint`` objects (built on demand)."""
+        for i, ts in enumerate(self.recorded_at):
+            yield HourlyPoint(
+                recorded_at=ts,
+                aqi=self.aqi[i],
+                pollutants=PollutantSet(*(
+                    self.pollutants[name][i] if name in self.pollutants else None
+                    for name in POLLUTANT_FIELDS
+                )),
+            )
+
+    def to_frame(self):
+        """pandas DataFrame with ``recorded_at``, ``aqi`` and one column per pollutant."""
+        import pandas as pd
+
+        data = {"recorded_at": pd.to_datetime(list(self.recorded_at)), "aqi": list(self.aqi)}
+        data.update({name: list(col) for name, col in self.pollutants.items()})
+        return pd.DataFrame(data)
+
+
+@dataclass(frozen=True)
+class AQISnapshot:
+    """Current readings for a set of cities, taken together.
+
+    ``readings`` is aligned with ``cities``; a city whose reading failed
+    holds ``None``. ``version`` is a short digest of every reading, so
+    anything derived from a snapshot (such as rendered map HTML) can be
+    cached per version and shared between sessions.
+    """
+
+    __slots__ = ("cities", "readings", "version")
+
+    cities: tuple
+    readings: tuple
+    version: str
+
+    @classmethod
+    def from_readings(cls, readings):
+        """Build from a ``{city: CurrentAQI or None}`` mapping."""
+        cities = tuple(sorted(readings))
+        values = tuple(readings[city] for city in cities)
+        digest = hashlib.sha1(repr(values).encode()).hexdigest()[:16]
+        return cls(cities=cities, readings=values, version=digest)
+
+    def get(self, city):
+        try:
+            return self.readings[self.cities.index(city)]
+        except ValueError:
+            return None
+
+    def items(self):
+        return zip(self.cities, self.readings)
+
+    def __len__(self):
+        return len(self.cities)
+
+
+@dataclass(frozen=True)
+class StationStatus:
+    """Health of one station: ``state`` is "online", "stale" or "offline".
+
+    ``age`` is seconds since the station's reading was recorded and
+    ``latency`` the duration of its last backend fetch; either may be ``None``.
+    """
+
+    __slots__ = ("city", "state", "age", "latency", "error")
+
+    city: str
+    state: str
+    age: float
+    latency: float
+    error: str
+
+
+def parse_cities(raw):
+    if not isinstance(raw, list) or not all(isinstance(c, str) for c in raw):
+        raise SchemaError("Expected a list of city names")
+    return tuple(raw)
@@ -0,0 +1,82 @@
+import atexit
+import logging
+import os
+import random
+import threading
+
+from services import api_client
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_ENABLED = os.getenv("PREFETCH_ENABLED", "1") == "1"
+# Keep the cadence below CACHE_TTL_CURRENT so page renders find fresh entries.
+PREFETCH_INTERVAL = float(os.getenv("PREFETCH_INTERVAL", "240"))
+PREFETCH_JITTER = float(os.getenv("PREFETCH_JITTER", "0.1"))
+
+
+class PrefetchScheduler:
+    """Daemon thread that periodically refreshes every city into the shared cache."""
+
+    def __init__(self, interval=PREFETCH_INTERVAL, jitter=PREFETCH_JITTER):
+        self.interval = interval
+        self.jitter = jitter
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="aqi-prefetch", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self):
+        try:
+            cities = api_client.refresh_all()
+            logger.info(f"Prefetched AQI data for {len(cities)} cities")
+        except Exception as e:
+            logger.error(f"Prefetch cycle failed: {e}")
+
+    def next_delay(self):
+        """Interval with +/- ``jitter`` spread so workers don't hit the backend in lockstep."""
+        spread = self.interval * self.jitter
+        return max(1.0, self.interval + random.uniform(-spread, spread))
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.next_delay())
+
+
+# ---------------- PROCESS-WIDE SINGLETON ----------------
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def start_prefetcher():
+    """Start the prefetch scheduler once per process; safe to call on every rerun."""
+    global _scheduler
+    if not PREFETCH_ENABLED:
+        return None
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = PrefetchScheduler()
+            atexit.register(stop_prefetcher)
+        _scheduler.start()
+        return _scheduler
+
+
+def stop_prefetcher():
+    with _scheduler_lock:
+        if _scheduler is not None:
+            _scheduler.stop()
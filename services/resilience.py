@@ -0,0 +1,96 @@
+import logging
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter.
+
+    The n-th retry sleeps a random time in ``[0, min(backoff_max, backoff_base * 2**n)]``.
+    """
+
+    def __init__(self, retries=2, backoff_base=0.5, backoff_max=8.0, jitter=True):
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+
+    def delays(self):
+        for attempt in range(self.retries):
+            ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+            yield random.uniform(0, ceiling) if self.jitter else ceiling
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail fast. Once ``reset_timeout`` has passed a single caller is let
+    through as a half-open trial; if ``probe`` is given it must succeed first.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name, failure_threshold=3, reset_timeout=30.0, probe=None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe = probe
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN:
+                return False  # a trial call is already in flight
+            if time.time() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+
+        if self.probe is not None:
+            try:
+                healthy = bool(self.probe())
+            except Exception:
+                healthy = False
+            if not healthy:
+                self.record_failure()
+                return False
+        return True
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit {self.name} closed")
+            self.state = self.CLOSED
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.error(f"Circuit {self.name} opened after {self.failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.time()
+
+    def snapshot(self):
+        with self._lock:
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.reset_timeout - (time.time() - self.opened_at))
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "opened_at": self.opened_at,
+                "retry_in": retry_in,
+            }
@@ -0,0 +1,118 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_PATH = Path(__file__).resolve().parent.parent / ".cache" / "snapshots.sqlite3"
+
+
+class SnapshotStore:
+    """Last-known-good payloads on disk, one row per (endpoint, key).
+
+    Written after every successful fetch and read once at process start so
+    a restarted server can render immediately from the latest snapshot.
+    Any SQLite error disables the store instead of breaking the caller.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                " endpoint TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " PRIMARY KEY (endpoint, key))"
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Snapshot store disabled ({self.path}): {e}")
+            self._conn = None
+
+    @property
+    def enabled(self):
+        return self._conn is not None
+
+    def save(self, endpoint, key, payload, fetched_at=None):
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO snapshots (endpoint, key, payload, fetched_at) VALUES (?, ?, ?, ?)",
+                    (endpoint, key, json.dumps(payload), fetched_at or time.time()),
+                )
+        except (TypeError, ValueError, sqlite3.Error) as e:
+            logger.error(f"Snapshot save failed for {endpoint}:{key}: {e}")
+
+    def touch(self, endpoint, key, fetched_at=None):
+        """Mark an existing snapshot as confirmed current (e.g. after a 304)."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE snapshots SET fetched_at = ? WHERE endpoint = ? AND key = ?",
+                    (fetched_at or time.time(), endpoint, key),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Snapshot touch failed for {endpoint}:{key}: {e}")
+
+    def load_all(self):
+        """List of ``(endpoint, key, payload, fetched_at)`` for every stored snapshot."""
+        if self._conn is None:
+            return []
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT endpoint, key, payload, fetched_at FROM snapshots"
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Snapshot load failed: {e}")
+            return []
+
+        snapshots = []
+        for endpoint, key, payload, fetched_at in rows:
+            try:
+                snapshots.append((endpoint, key, json.loads(payload), fetched_at))
+            except ValueError:
+                continue
+        return snapshots
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class NullSnapshotStore:
+    enabled = False
+
+    def save(self, endpoint, key, payload, fetched_at=None):
+        pass
+
+    def touch(self, endpoint, key, fetched_at=None):
+        pass
+
+    def load_all(self):
+        return []
+
+    def close(self):
+        pass
+
+
+def open_snapshot_store():
+    if os.getenv("SNAPSHOT_ENABLED", "1") != "1":
+        return NullSnapshotStore()
+    return SnapshotStore(os.getenv("SNAPSHOT_PATH", str(DEFAULT_SNAPSHOT_PATH)))
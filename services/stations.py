@@ -0,0 +1,181 @@
+import csv
+import heapq
+import logging
+import math
+import os
+from array import array
+from functools import lru_cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# ---------------- STATION REGISTRY ----------------
+# Station coordinates live in one data file and are loaded once per process.
+# Names and coordinates are kept in flat arrays; a KD-tree over the stations'
+# 3-D unit vectors (so distances are exact on the sphere, no lon/lat
+# wrap-around) answers nearest-station and within-radius queries without
+# scanning every station.
+STATIONS_PATH = os.getenv(
+    "STATIONS_PATH", str(Path(__file__).resolve().parent.parent / "assets" / "data" / "stations.csv")
+)
+EARTH_RADIUS_KM = 6371.0088
+
+
+def _unit_vector(lat, lon):
+    phi, lam = math.radians(lat), math.radians(lon)
+    return math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi)
+
+
+def _chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+def _km_to_chord(km):
+    return 2 * math.sin(min(math.pi, km / EARTH_RADIUS_KM) / 2)
+
+
+class StationRegistry:
+    """Station names and coordinates with a spatial index.
+
+    ``stations`` is an iterable of ``(name, lat, lon)``; later duplicates of a
+    name are ignored. Query results are ``(name, distance_km)`` pairs, nearest first.
+    """
+
+    def __init__(self, stations):
+        self.names = []
+        self.lat = array("d")
+        self.lon = array("d")
+        self._positions = {}
+        for name, lat, lon in stations:
+            if name in self._positions:
+                continue
+            self._positions[name] = len(self.names)
+            self.names.append(name)
+            self.lat.append(float(lat))
+            self.lon.append(float(lon))
+        self.names = tuple(self.names)
+
+        self._axes = (array("d"), array("d"), array("d"))
+        for lat, lon in zip(self.lat, self.lon):
+            for axis, value in zip(self._axes, _unit_vector(lat, lon)):
+                axis.append(value)
+        self._tree = array("i", range(len(self.names)))
+        self._build()
+
+    @classmethod
+    def from_csv(cls, path):
+        """Registry from a ``name,lat,lon`` CSV file."""
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls((row["name"].strip(), row["lat"], row["lon"]) for row in csv.DictReader(f))
+
+    def _build(self):
+        # Implicit KD-tree: each range of self._tree is sorted so its middle
+        # element splits the rest on axis depth % 3.
+        stack = [(0, len(self._tree), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo < 2:
+                continue
+            axis = self._axes[depth % 3]
+            self._tree[lo:hi] = array("i", sorted(self._tree[lo:hi], key=axis.__getitem__))
+            mid = (lo + hi) // 2
+            stack.append((lo, mid, depth + 1))
+            stack.append((mid + 1, hi, depth + 1))
+
+    def _search(self, point, visit, bound):
+        """Walk the tree nearest-branch first, calling ``visit(i, chord²)`` on
+        each station; a far branch is skipped once ``bound()`` (a squared chord)
+        is below its distance from ``point``.
+        """
+        tree, axes = self._tree, self._axes
+        x, y, z = point
+        stack = [(0, len(tree), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            i = tree[mid]
+            visit(i, (x - axes[0][i]) ** 2 + (y - axes[1][i]) ** 2 + (z - axes[2][i]) ** 2)
+            diff = point[depth % 3] - axes[depth % 3][i]
+            near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+            if diff * diff <= bound():
+                stack.append((*far, depth + 1))
+            stack.append((*near, depth + 1))
+
+    def nearest(self, lat, lon, k=1):
+        """The ``k`` stations closest to ``(lat, lon)``."""
+        best = []  # max-heap of (-chord², index)
+
+        def visit(i, d2):
+            if len(best) < k:
+                heapq.heappush(best, (-d2, i))
+            elif d2 < -best[0][0]:
+                heapq.heapreplace(best, (-d2, i))
+
+        if k > 0 and self.names:
+            self._search(_unit_vector(lat, lon), visit, lambda: -best[0][0] if len(best) >= k else math.inf)
+        return [(self.names[i], _chord_to_km(math.sqrt(-d2))) for d2, i in sorted(best, reverse=True)]
+
+    def within(self, lat, lon, radius_km):
+        """Every station within ``radius_km`` of ``(lat, lon)``."""
+        limit = _km_to_chord(radius_km) ** 2
+        found = []
+
+        def visit(i, d2):
+            if d2 <= limit:
+                found.append((d2, i))
+
+        if self.names:
+            self._search(_unit_vector(lat, lon), visit, lambda: limit)
+        return [(self.names[i], _chord_to_km(math.sqrt(d2))) for d2, i in sorted(found)]
+
+    def coords(self, name):
+        """``(lat, lon)`` of ``name``, or ``None`` if it is not registered."""
+        i = self._positions.get(name)
+        return None if i is None else (self.lat[i], self.lon[i])
+
+    def coords_map(self, names=None):
+        """``{name: (lat, lon)}`` for ``names`` (default: all), skipping unknown names."""
+        names = self.names if names is None else names
+        return {name: self.coords(name) for name in names if name in self._positions}
+
+    def missing(self, names):
+        """Names in ``names`` that have no registered coordinates."""
+        return [name for name in names if name not in self._positions]
+
+    def __contains__(self, name):
+        return name in self._positions
+
+    def __len__(self):
+        return len(self.names)
+
+
+@lru_cache(maxsize=1)
+def station_registry():
+    """The process-wide registry loaded from ``STATIONS_PATH``."""
+    try:
+        registry = StationRegistry.from_csv(STATIONS_PATH)
+    except (OSError, KeyError, ValueError) as e:
+        logger.error(f"Station registry unavailable ({STATIONS_PATH}): {e}")
+        return StationRegistry(())
+    logger.info(f"Loaded {len(registry)} stations from {STATIONS_PATH}")
+    return registry
+
+
+@lru_cache(maxsize=8)
+def _warn_missing(names):
+    logger.warning(f"No coordinates registered for: {', '.join(names)}")
+
+
+def station_coords(cities):
+    """``{city: (lat, lon)}`` for the backend's ``cities``.
+
+    Cities the backend reports but the registry does not know are left out
+    (and logged once), so the map and the city list cannot silently disagree.
+    """
+    registry = station_registry()
+    missing = registry.missing(cities)
+    if missing:
+        _warn_missing(tuple(missing))
+    return registry.coords_map(cities)
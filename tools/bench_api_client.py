@@ -0,0 +1,51 @@
+"""Offline benchmark of the API client against the local fake backend.
+
+    python -m tools.bench_api_client --cities 24 --latency 200
+
+Compares a serial loop of ``get_current_aqi`` with ``get_current_aqi_batch``
+and a cold vs warm read through the shared cache.
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.fake_backend import start_fake_backend
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cities", type=int, default=6)
+    parser.add_argument("--latency", type=float, default=200.0, help="backend latency in ms")
+    parser.add_argument("--concurrency", type=int, default=6)
+    args = parser.parse_args(argv)
+
+    server = start_fake_backend(cities=args.cities, latency_ms=args.latency)
+    os.environ["BACKEND_BASE_URL"] = server.base_url
+    os.environ["SNAPSHOT_ENABLED"] = "0"
+    from services import api_client
+
+    cities = list(api_client.get_cities())
+    rows = [
+        ("serial get_current_aqi", _timed(lambda: [api_client.get_current_aqi(c) for c in cities])),
+        ("get_current_aqi_batch", _timed(lambda: api_client.get_current_aqi_batch(cities, args.concurrency))),
+        ("cached batch (cold)", _timed(lambda: api_client.cached_current_aqi_batch(cities, args.concurrency))),
+        ("cached batch (warm)", _timed(lambda: api_client.cached_current_aqi_batch(cities, args.concurrency))),
+    ]
+    print(f"{len(cities)} cities, {args.latency:.0f} ms backend latency, concurrency {args.concurrency}")
+    for label, ms in rows:
+        print(f"  {label:<26} {ms:9.1f} ms")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Server cost of a Dashboard interaction: full-script rerun vs fragment rerun.
+
+    python -m tools.bench_dashboard_rerun --runs 20 --latency 50
+
+Drives ``pages/Dashboard.py`` through Streamlit's in-process test runner
+against the local fake backend. A city click is replayed the way the
+browser sends it, once as a full-script rerun (what every interaction cost
+before the page used ``st.fragment``) and once scoped to the live-sections
+fragment. For each it reports server CPU time (``time.process_time``) and
+the bytes of ForwardMsg protobufs the session would send to the browser.
+
+The harness uses ``streamlit.testing`` internals (the same ones ``AppTest``
+is built on), so it tracks the Streamlit version pinned in requirements.txt.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from tools.fake_backend import start_fake_backend
+
+DASHBOARD = str(ROOT_DIR / "pages" / "Dashboard.py")
+
+
+class DashboardSession:
+    """One simulated browser session whose fragments survive between reruns."""
+
+    def __init__(self, script=DASHBOARD, timeout=30):
+        from streamlit.runtime.fragment import MemoryFragmentStorage
+        from streamlit.runtime.state import SafeSessionState, SessionState
+
+        self.script = script
+        self.timeout = timeout
+        self.session_state = SafeSessionState(SessionState(), lambda: None)
+        self.fragments = MemoryFragmentStorage()
+        # Hashes of cacheable messages the browser already holds; like the
+        # real frontend, each rerun reports them so the server can send refs.
+        self.browser_cache = set()
+        self.tree = None
+
+    def run(self, widget_states=None, fragment_id=None):
+        """Rerun the page (or one fragment); returns ``(cpu_seconds, bytes_sent, messages)``."""
+        from streamlit.runtime import Runtime
+        from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+        from streamlit.runtime.media_file_manager import MediaFileManager
+        from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+        from streamlit.runtime.pages_manager import PagesManager
+        from streamlit.runtime.scriptrunner import RerunData
+        from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+        from streamlit.testing.v1.element_tree import parse_tree_from_messages
+        from streamlit.testing.v1.local_script_runner import LocalScriptRunner, require_widgets_deltas
+        from streamlit.testing.v1.util import patch_config_options
+
+        runtime = MagicMock(spec=Runtime)
+        runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+        runtime.cache_storage_manager = MemoryCacheStorageManager()
+        Runtime._instance = runtime
+        pages_manager = PagesManager(self.script, ScriptCache(), setup_watcher=False)
+
+        runner = LocalScriptRunner(self.script, self.session_state, pages_manager)
+        runner._fragment_storage = self.fragments
+        rerun = RerunData(
+            widget_states=widget_states,
+            fragment_id_queue=[fragment_id] if fragment_id else [],
+            is_fragment_scoped_rerun=fragment_id is not None,
+            cached_message_hashes=set(self.browser_cache),
+        )
+        try:
+            with patch_config_options({"global.appTest": True}):
+                cpu_start = time.process_time()
+                runner.request_rerun(rerun)
+                runner.start()
+                require_widgets_deltas(runner, self.timeout)
+                cpu = time.process_time() - cpu_start
+        finally:
+            Runtime._instance = None
+
+        messages = list(runner.forward_msgs())
+        self.browser_cache.update(m.hash for m in messages if m.metadata.cacheable)
+        if fragment_id is None:
+            self.tree = parse_tree_from_messages(messages)
+            self.tree._runner = self  # widgets such as text inputs read their value via session_state
+        return cpu, sum(m.ByteSize() for m in messages), messages
+
+    def click(self, label):
+        """Widget states the browser would send after clicking button ``label``."""
+        for button in self.tree.button:
+            if button.label == label:
+                button.click()
+                return self.tree.get_widget_states()
+        raise LookupError(f"No button labelled {label!r}")
+
+
+def fragment_ids(messages):
+    return {m.delta.fragment_id for m in messages if m.HasField("delta") and m.delta.fragment_id}
+
+
+def _summary(samples):
+    cpu = [s[0] * 1000 for s in samples]
+    sent = [s[1] for s in samples]
+    return statistics.median(cpu), statistics.median(sent)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="interactions measured per mode")
+    parser.add_argument("--latency", type=float, default=50.0, help="backend latency in ms")
+    parser.add_argument("--cities", type=int, default=6, help="number of synthetic cities")
+    args = parser.parse_args(argv)
+
+    server = start_fake_backend(cities=args.cities, latency_ms=args.latency)
+    os.environ["BACKEND_BASE_URL"] = server.base_url
+    os.environ.setdefault("SNAPSHOT_ENABLED", "0")
+    os.environ.setdefault("PREFETCH_ENABLED", "0")
+    from services import api_client
+
+    cities = list(api_client.get_cities())
+    api_client.refresh_all()  # measure rendering cost, not backend latency
+
+    session = DashboardSession()
+    _, _, messages = session.run()
+    ids = fragment_ids(messages)
+    if len(ids) != 1:
+        raise SystemExit(f"Expected one live-sections fragment, found {len(ids)}")
+    fragment_id = ids.pop()
+
+    # With many cities only one page of buttons is drawn; click those.
+    visible = [button.label for button in session.tree.button if button.label in set(cities)]
+    full, scoped = [], []
+    for i in range(args.runs):
+        city = visible[i % len(visible)]
+        full.append(session.run(session.click(city))[:2])
+        scoped.append(session.run(session.click(city), fragment_id=fragment_id)[:2])
+
+    print(f"Dashboard city click, median of {args.runs} runs ({len(cities)} cities, warm cache)")
+    print(f"  {'mode':<18} {'CPU ms':>9} {'bytes sent':>11}")
+    for label, samples in (("full rerun", full), ("fragment rerun", scoped)):
+        cpu_ms, sent = _summary(samples)
+        print(f"  {label:<18} {cpu_ms:9.1f} {sent:11,.0f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
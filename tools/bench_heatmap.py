@@ -0,0 +1,91 @@
+"""Heat layer build time and size against grid resolution and station count.
+
+    python -m tools.bench_heatmap --stations 6 100 1000 --grid 96 192 384
+
+For synthetic stations over India (see ``tools.bench_map``) times the
+``components.heatmap`` stages per (stations, grid): the vectorized IDW, the
+colour mapping and PNG encoding, and reports the PNG size that is inlined in
+the map page. This is the cost paid once per snapshot, not per visitor.
+
+Each run also checks the grid's nearest-station distances against a
+brute-force loop over the stations and exits non-zero on a mismatch.
+"""
+import argparse
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.bench_map import synthetic_stations
+
+
+def timed_ms(fn, repeat):
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), result
+
+
+def nearest_error_km(lats, lons, grid_lats, grid_lons, nearest, samples=64):
+    """Largest gap between ``nearest`` and a per-station loop, over sampled cells."""
+    import math
+    import random
+
+    rng = random.Random(0)
+    worst = 0.0
+    for _ in range(samples):
+        row, col = rng.randrange(len(grid_lats)), rng.randrange(len(grid_lons))
+        lat, lon = float(grid_lats[row]), float(grid_lons[col])
+        expected = min(
+            math.hypot((lat - s_lat) * 110.574, (lon - s_lon) * 111.320 * math.cos(math.radians(lat)))
+            for s_lat, s_lon in zip(lats, lons)
+        )
+        worst = max(worst, abs(float(nearest[row, col]) - expected))
+    return worst
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, nargs="+", default=[6, 100, 1000])
+    parser.add_argument("--grid", type=int, nargs="+", default=[96, 192, 384])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    from PIL import Image
+
+    from components import heatmap
+
+    failed = False
+    print(f"  {'stations':>8} {'grid':>9} {'idw ms':>8} {'color ms':>9} {'png ms':>7} {'png KiB':>8} {'err km':>7}")
+    for count in args.stations:
+        snapshot, coords = synthetic_stations(count)
+        lats, lons, values = heatmap.station_values(snapshot, coords)
+        bounds = heatmap.heat_bounds(lats, lons)
+        for size in args.grid:
+            grid_lats, grid_lons = heatmap.grid_axes(bounds, size)
+            idw_ms, (estimate, nearest) = timed_ms(
+                lambda: heatmap.idw_grid(lats, lons, values, grid_lats, grid_lons), args.repeat
+            )
+            color_ms, image = timed_ms(lambda: heatmap.colorize(estimate, nearest), args.repeat)
+
+            def encode():
+                png = io.BytesIO()
+                Image.fromarray(image).save(png, format="PNG")
+                return png.getvalue()
+
+            png_ms, png = timed_ms(encode, args.repeat)
+            error = nearest_error_km(lats, lons, grid_lats, grid_lons, nearest)
+            failed |= error > 1.0
+            shape = f"{grid_lons.size}x{grid_lats.size}"
+            print(f"  {count:8d} {shape:>9} {idw_ms:8.1f} {color_ms:9.1f} {png_ms:7.1f} {len(png) / 1024:8.1f} {error:7.3f}")
+    if failed:
+        sys.exit("nearest-station distances disagree with the brute-force check")
+
+
+if __name__ == "__main__":
+    main()
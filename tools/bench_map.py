@@ -0,0 +1,109 @@
+"""Home map payload and build time as the station count grows.
+
+    python -m tools.bench_map --stations 6 100 1000 5000
+
+Builds the map for synthetic stations spread over India in both modes of
+``components.maps`` and reports build time and what the browser downloads:
+
+* markers: the whole map page, one CircleMarker per station;
+* cluster: the map page plus the tile index (initial, zoomed-out view),
+  and the median bytes of the tiles a zoomed-in viewport loads.
+
+Tiles are written to a temporary directory, not ``static/map``.
+
+Static serving is set explicitly rather than read from whichever
+``.streamlit/config.toml`` is active: on by default (as in this repo's
+config), ``--inline-tiles`` measures the fallback that inlines every tile
+into the page. The interpolated heat layer is included unless ``--no-heat``.
+"""
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.fake_backend import SyntheticData
+
+# Rough bounding box of mainland India.
+LAT_RANGE = (8.0, 34.0)
+LON_RANGE = (68.0, 97.0)
+# A zoomed-in (detail zoom) viewport spans roughly this many degrees.
+VIEWPORT_DEGREES = (5.0, 3.5)
+
+
+def synthetic_stations(count, seed=0):
+    from services.models import AQISnapshot, CurrentAQI
+
+    rng = random.Random(seed)
+    data = SyntheticData(count, seed=seed)
+    now = datetime.now(timezone.utc)
+    coords = {city: (rng.uniform(*LAT_RANGE), rng.uniform(*LON_RANGE)) for city in data.cities}
+    readings = {city: CurrentAQI.from_dict(data.current(city, now), city) for city in data.cities}
+    return AQISnapshot.from_readings(readings), coords
+
+
+def viewport_tile_bytes(index, tiles, rng, samples=50):
+    """Median bytes of the tiles covering random detail-zoom viewports."""
+    cell = index["cell"]
+    sizes = []
+    for _ in range(samples):
+        south = rng.uniform(LAT_RANGE[0], LAT_RANGE[1] - VIEWPORT_DEGREES[1])
+        west = rng.uniform(LON_RANGE[0], LON_RANGE[1] - VIEWPORT_DEGREES[0])
+        total = 0
+        for x in range(math.floor(west / cell), math.floor((west + VIEWPORT_DEGREES[0]) / cell) + 1):
+            for y in range(math.floor(south / cell), math.floor((south + VIEWPORT_DEGREES[1]) / cell) + 1):
+                tile = tiles.get(f"{x}_{y}")
+                if tile is not None:
+                    total += len(json.dumps(tile, separators=(",", ":")))
+        sizes.append(total)
+    return statistics.median(sizes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, nargs="+", default=[6, 100, 1000, 5000])
+    parser.add_argument("--max-markers", type=int, default=5000, help="skip markers mode above this count")
+    parser.add_argument("--inline-tiles", action="store_true",
+                        help="measure with server.enableStaticServing off (tiles inlined into the page)")
+    parser.add_argument("--heat", action=argparse.BooleanOptionalAction, default=True,
+                        help="include the interpolated heat layer")
+    args = parser.parse_args(argv)
+
+    from streamlit import config
+
+    from components import heatmap, maps
+
+    config.set_option("server.enableStaticServing", not args.inline_tiles)
+    heatmap.HEAT_ENABLED = args.heat
+    maps.TILE_DIR = Path(tempfile.mkdtemp(prefix="skyguard-map-"))
+    rng = random.Random(1)
+
+    tiles = "inlined into the page" if args.inline_tiles else "served from static/ (server.enableStaticServing)"
+    print(f"cluster tiles: {tiles}; heat layer: {'on' if args.heat else 'off'}")
+
+    print(f"  {'stations':>8} {'mode':<8} {'build ms':>9} {'page KiB':>9} {'index KiB':>10} {'viewport KiB':>13}")
+    for count in args.stations:
+        snapshot, coords = synthetic_stations(count)
+        for mode in ("markers", "cluster"):
+            if mode == "markers" and count > args.max_markers:
+                continue
+            start = time.perf_counter()
+            html = maps.aqi_map_html(snapshot, coords, mode=mode)
+            build_ms = (time.perf_counter() - start) * 1000
+            index_kib = viewport_kib = float("nan")
+            if mode == "cluster":
+                index, tiles = maps.station_tiles(snapshot, coords)
+                index_kib = len(json.dumps(index, separators=(",", ":"))) / 1024
+                viewport_kib = viewport_tile_bytes(index, tiles, rng) / 1024
+            print(f"  {count:8d} {mode:<8} {build_ms:9.1f} {len(html) / 1024:9.1f} {index_kib:10.1f} {viewport_kib:13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Bytes each page sends to the browser on a rerun.
+
+    python -m tools.bench_rerun_bytes
+
+Runs every page twice in one simulated session (warm cache, no splash)
+against the local fake backend and reports the ForwardMsg bytes of the
+second, steady-state rerun, split into ``<style>``/stylesheet markdown
+and everything else.
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from tools.bench_dashboard_rerun import DashboardSession
+from tools.fake_backend import start_fake_backend
+
+PAGES = ("Home.py", "pages/Dashboard.py", "pages/About.py", "pages/Contact.py")
+
+
+def _is_style(msg):
+    if not msg.HasField("delta") or not msg.delta.HasField("new_element"):
+        return False
+    element = msg.delta.new_element
+    if element.WhichOneof("type") == "markdown":
+        body = element.markdown.body.lstrip()
+        return body.startswith("<style") or body.startswith("<link")
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", default=PAGES)
+    args = parser.parse_args(argv)
+
+    server = start_fake_backend()
+    os.environ["BACKEND_BASE_URL"] = server.base_url
+    os.environ.setdefault("SNAPSHOT_ENABLED", "0")
+    os.environ.setdefault("PREFETCH_ENABLED", "0")
+    from services import api_client
+
+    api_client.refresh_all()
+
+    print(f"  {'page':<22} {'styles B':>9} {'other B':>9} {'total B':>9}")
+    for page in args.pages:
+        session = DashboardSession(str(ROOT_DIR / page))
+        session.run()
+        _, total, messages = session.run()
+        styles = sum(m.ByteSize() for m in messages if _is_style(m))
+        print(f"  {page:<22} {styles:9,d} {total - styles:9,d} {total:9,d}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
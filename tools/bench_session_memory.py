@@ -0,0 +1,125 @@
+"""Per-session memory of the Dashboard's session state at 100 and 1,000 sessions.
+
+    python -m tools.bench_session_memory --sessions 100 1000
+
+Simulates concurrent Dashboard sessions spread over the fake backend's
+cities and measures, with ``tracemalloc``, what their ``SessionState``
+objects cost in three layouts:
+
+* copies: each session keeps its own parsed reading and 24h history
+  (the old ``current_city_data`` / ``current_city_history`` entries);
+* shared: each session references the shared ``DashboardView``;
+* key: each session keeps only ``dashboard_view_key`` (current layout).
+
+Shared data (the view store itself) is loaded before measuring, so the
+numbers are the per-session overhead on top of it.
+
+A second table covers long-running servers, where sessions were last
+rendered at different data versions. Each session saw its own version, the
+store evicts beyond ``VIEW_CACHE_MAX``, and memory is measured including the
+views themselves: a "shared" reference keeps every evicted view alive,
+while a "key" lets the store's bound decide.
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.fake_backend import start_fake_backend
+
+
+def _measure(count, fill):
+    from streamlit.runtime.state import SessionState
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = []
+    for i in range(count):
+        state = SessionState()
+        fill(i, state)
+        sessions.append(state)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--cities", type=int, default=6)
+    args = parser.parse_args(argv)
+
+    server = start_fake_backend(cities=args.cities)
+    os.environ["BACKEND_BASE_URL"] = server.base_url
+    os.environ.setdefault("SNAPSHOT_ENABLED", "0")
+    from services import api_client
+    from services.dashboard_view import load_dashboard_view
+    from services.models import AQIHistory, CurrentAQI
+
+    cities = list(api_client.get_cities())
+    views = [
+        load_dashboard_view(city, api_client.cached_current_aqi(city))
+        for city in cities
+    ]
+
+    now = datetime.now(timezone.utc)
+    raw = [(city, server.data.current(city, now), server.data.last_24_hours(city, now)) for city in cities]
+
+    def copies(i, state):
+        # Each session parsed its own response, so it held its own objects.
+        city, current, history = raw[i % len(raw)]
+        state["selected_city"] = city
+        state["current_city_data"] = CurrentAQI.from_dict(current, city)
+        state["current_city_history"] = AQIHistory.from_rows(history, city)
+
+    def shared(i, state):
+        view = views[i % len(views)]
+        state["selected_city"] = view.city
+        state["dashboard_view"] = view
+
+    def key(i, state):
+        view = views[i % len(views)]
+        state["selected_city"] = view.city
+        state["dashboard_view_key"] = view.key
+
+    print(f"Dashboard session state, {len(cities)} cities")
+    print(f"  {'layout':<8} {'sessions':>9} {'total KiB':>10} {'per session':>12}")
+    for count in args.sessions:
+        for label, fill in (("copies", copies), ("shared", shared), ("key", key)):
+            used = _measure(count, fill)
+            print(f"  {label:<8} {count:9d} {used / 1024:10.1f} {used / count:10.0f} B")
+
+    from services import dashboard_view
+
+    def versioned(i):
+        # Session i last rendered its city i hours ago: a distinct data version.
+        city, current, _ = raw[i % len(raw)]
+        recorded_at = datetime.fromisoformat(current["recorded_at"]) - timedelta(hours=i)
+        reading = CurrentAQI.from_dict({**current, "recorded_at": recorded_at.isoformat()}, city)
+        return dashboard_view.load_dashboard_view(city, reading)
+
+    def rolling_shared(i, state):
+        state["dashboard_view"] = versioned(i)
+
+    def rolling_key(i, state):
+        state["dashboard_view_key"] = versioned(i).key
+
+    print(f"\nSessions at distinct data versions, views included (VIEW_CACHE_MAX={dashboard_view.VIEW_CACHE_MAX})")
+    print(f"  {'layout':<8} {'sessions':>9} {'total KiB':>10} {'per session':>12}")
+    for count in args.sessions:
+        for label, fill in (("shared", rolling_shared), ("key", rolling_key)):
+            dashboard_view._views.invalidate()
+            used = _measure(count, fill)
+            print(f"  {label:<8} {count:9d} {used / 1024:10.1f} {used / count:10.0f} B")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Station registry query time as the station count grows.
+
+    python -m tools.bench_stations --stations 6 1000 10000 50000
+
+Builds a ``services.stations.StationRegistry`` over random stations in
+India and times ``nearest`` and ``within`` for random points against a
+linear haversine scan, checking that both return the same stations.
+"""
+import argparse
+import math
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.stations import EARTH_RADIUS_KM, StationRegistry
+from tools.bench_map import LAT_RANGE, LON_RANGE
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin((p2 - p1) / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def scan(registry, lat, lon):
+    return sorted(
+        (haversine_km(lat, lon, registry.lat[i], registry.lon[i]), name) for i, name in enumerate(registry.names)
+    )
+
+
+def timed_us(fn, points):
+    times = []
+    for lat, lon in points:
+        start = time.perf_counter()
+        fn(lat, lon)
+        times.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, nargs="+", default=[6, 1000, 10000, 50000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--radius", type=float, default=50.0, help="km, for within()")
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    print(f"  {'stations':>8} {'build ms':>9} {'nearest µs':>11} {'within µs':>10} {'scan µs':>9}")
+    for count in args.stations:
+        stations = [(f"S{i:06d}", rng.uniform(*LAT_RANGE), rng.uniform(*LON_RANGE)) for i in range(count)]
+        start = time.perf_counter()
+        registry = StationRegistry(stations)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        points = [(rng.uniform(*LAT_RANGE), rng.uniform(*LON_RANGE)) for _ in range(args.queries)]
+        for lat, lon in points[:20]:
+            expected = scan(registry, lat, lon)
+            got = registry.nearest(lat, lon, k=args.k)
+            assert [n for n, _ in got] == [n for _, n in expected[:args.k]], (lat, lon)
+            inside = {n for d, n in expected if d <= args.radius}
+            assert {n for n, _ in registry.within(lat, lon, args.radius)} == inside, (lat, lon)
+
+        nearest_us = timed_us(lambda lat, lon: registry.nearest(lat, lon, k=args.k), points)
+        within_us = timed_us(lambda lat, lon: registry.within(lat, lon, args.radius), points)
+        scan_us = timed_us(lambda lat, lon: scan(registry, lat, lon), points[:20])
+        print(f"  {count:8d} {build_ms:9.1f} {nearest_us:11.1f} {within_us:10.1f} {scan_us:9.0f}")
+
+
+if __name__ == "__main__":
+    main()
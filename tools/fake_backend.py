@@ -0,0 +1,216 @@
+"""Local stand-in for the SkyGuard backend.
+
+Serves ``/health/``, ``/cities``, ``/aqi/current`` and ``/aqi/last-24-hours``
+with synthetic (or replayed) data so the app and benchmarks run offline::
+
+    python -m tools.fake_backend --port 8000 --latency 150 --error-rate 0.05
+    BACKEND_BASE_URL=http://127.0.0.1:8000 streamlit run Home.py
+
+Synthetic readings are deterministic per (city, hour), so ETags stay stable
+within an hour and benchmark runs are repeatable. ``--replay DIR`` serves
+fixtures captured by ``tools.record_fixtures`` instead.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, quote, urlparse
+
+BASE_CITIES = ["Delhi", "Mumbai", "Ahmedabad", "Bengaluru", "Kolkata", "Chennai"]
+POLLUTANT_RANGES = {
+    "pm2_5": (5, 250), "pm10": (10, 400), "co": (200, 2500), "no2": (5, 120),
+    "so2": (1, 60), "o3": (10, 180), "nh3": (1, 40),
+}
+
+
+def city_names(count):
+    """The six production cities first, then numbered synthetic stations."""
+    names = BASE_CITIES[:count]
+    names += [f"Station {i:04d}" for i in range(len(names) + 1, count + 1)]
+    return names
+
+
+def fixture_path(root, kind, city=None):
+    root = Path(root)
+    if kind == "cities":
+        return root / "cities.json"
+    return root / kind / f"{quote(city, safe='')}.json"
+
+
+class SyntheticData:
+    def __init__(self, city_count=6, seed=0):
+        self.cities = city_names(city_count)
+        self._city_set = set(self.cities)
+        self.seed = seed
+
+    def has_city(self, city):
+        return city in self._city_set
+
+    def _reading(self, city, hour):
+        rng = random.Random(f"{self.seed}:{city}:{hour.isoformat()}")
+        pollutants = {name: round(rng.uniform(lo, hi), 2) for name, (lo, hi) in POLLUTANT_RANGES.items()}
+        aqi = min(5, 1 + int(pollutants["pm2_5"] // 50))
+        return aqi, pollutants
+
+    def current(self, city, now):
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        aqi, pollutants = self._reading(city, hour)
+        return {"city": city, "aqi": aqi, "pollutants": pollutants, "recorded_at": hour.isoformat()}
+
+    def last_24_hours(self, city, now):
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        rows = []
+        for h in range(23, -1, -1):
+            ts = hour - timedelta(hours=h)
+            aqi, pollutants = self._reading(city, ts)
+            rows.append({"recorded_at": ts.isoformat(), "aqi": aqi, **pollutants})
+        return rows
+
+
+class ReplayData:
+    def __init__(self, root):
+        self.root = Path(root)
+        self.cities = json.loads(fixture_path(root, "cities").read_text())
+
+    def has_city(self, city):
+        return fixture_path(self.root, "current", city).exists()
+
+    def current(self, city, now):
+        return json.loads(fixture_path(self.root, "current", city).read_text())
+
+    def last_24_hours(self, city, now):
+        path = fixture_path(self.root, "history", city)
+        return json.loads(path.read_text()) if path.exists() else []
+
+
+class FakeBackendHandler(BaseHTTPRequestHandler):
+    server_version = "SkyGuardFake/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        city = parse_qs(url.query).get("city", [None])[0]
+
+        if server.latency_ms:
+            jitter = random.uniform(-server.latency_jitter_ms, server.latency_jitter_ms)
+            time.sleep(max(0.0, server.latency_ms + jitter) / 1000)
+        if url.path != "/health/" and random.random() < server.error_rate:
+            return self._send_json(503, {"detail": "injected failure"})
+
+        now = datetime.now(timezone.utc)
+        data = server.data
+        if url.path in ("/health", "/health/"):
+            return self._send_json(200, {"status": "ok"})
+        if url.path == "/cities":
+            return self._send_json(200, data.cities)
+        if url.path in ("/aqi/current", "/aqi/last-24-hours"):
+            if not city or not data.has_city(city):
+                return self._send_json(404, {"detail": f"Unknown city {city!r}"})
+            if url.path == "/aqi/current":
+                return self._send_json(200, data.current(city, now))
+            return self._send_json(200, data.last_24_hours(city, now))
+        return self._send_json(404, {"detail": "Not found"})
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        # Data changes at most hourly, so the top of the hour is a fair Last-Modified.
+        modified = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+        if status == 200:
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, b"", {"ETag": etag})
+            since = self.headers.get("If-Modified-Since")
+            if since and "If-None-Match" not in self.headers:
+                try:
+                    if parsedate_to_datetime(since) >= modified:
+                        return self._send(304, b"", {"ETag": etag})
+                except (TypeError, ValueError):
+                    pass
+
+        headers = {"Content-Type": "application/json"}
+        if status == 200:
+            headers["ETag"] = etag
+            headers["Last-Modified"] = formatdate(modified.timestamp(), usegmt=True)
+        if "gzip" in self.headers.get("Accept-Encoding", "") and len(body) > 512:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        self._send(status, body, headers)
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+class FakeBackendServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, data, latency_ms=0.0, latency_jitter_ms=0.0, error_rate=0.0, verbose=False):
+        super().__init__(address, FakeBackendHandler)
+        self.data = data
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.verbose = verbose
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_fake_backend(host="127.0.0.1", port=0, cities=6, replay=None, seed=0, **options):
+    """Start a fake backend on a daemon thread; returns the server (see ``base_url``)."""
+    data = ReplayData(replay) if replay else SyntheticData(cities, seed=seed)
+    server = FakeBackendServer((host, port), data, **options)
+    threading.Thread(target=server.serve_forever, name="fake-backend", daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--cities", type=int, default=6, help="number of synthetic cities")
+    parser.add_argument("--latency", type=float, default=0.0, help="mean added latency in ms")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="+/- latency spread in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--replay", help="serve fixtures recorded by tools.record_fixtures from this directory")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    data = ReplayData(args.replay) if args.replay else SyntheticData(args.cities, seed=args.seed)
+    server = FakeBackendServer(
+        (args.host, args.port), data,
+        latency_ms=args.latency, latency_jitter_ms=args.latency_jitter,
+        error_rate=args.error_rate, verbose=args.verbose,
+    )
+    print(f"Fake backend on {server.base_url} ({len(data.cities)} cities)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
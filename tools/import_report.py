@@ -0,0 +1,82 @@
+"""Cold-start import cost of each page, from ``python -X importtime``.
+
+    python -m tools.import_report
+    python -m tools.import_report pages/Dashboard.py --top 20
+
+For every page a fresh interpreter imports Streamlit (the worker's own
+baseline) and then runs only the page's module-level ``import`` statements,
+including those inside top-level ``try`` blocks. Imports deferred into
+functions or sections are not counted, which is the point: the report shows
+what a cold worker must load before the page can start rendering.
+
+Prints per page the wall time of that interpreter, the import time on top of
+the Streamlit baseline, and the slowest top-level imports by cumulative time.
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+PAGES = ("Home.py", "pages/Dashboard.py", "pages/About.py", "pages/Contact.py")
+BASELINE = "import streamlit"
+
+
+def page_imports(path):
+    """Source of the module-level imports of ``path`` (top-level and in top-level ``try``)."""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    nodes = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            nodes.append(node)
+        elif isinstance(node, ast.Try):
+            nodes.extend(n for n in node.body if isinstance(n, (ast.Import, ast.ImportFrom)))
+    return "\n".join(ast.unparse(n) for n in nodes)
+
+
+def run_importtime(code):
+    """``(wall_seconds, [(self_us, cumulative_us, depth, module), ...])`` for ``code``."""
+    env = dict(os.environ, SNAPSHOT_ENABLED="0", PREFETCH_ENABLED="0", PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    wall = time.perf_counter() - start
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        module = name.rstrip()
+        depth = (len(module) - len(module.lstrip())) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, module.strip()))
+    return wall, rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", default=PAGES)
+    parser.add_argument("--top", type=int, default=8, help="slowest top-level imports to list per page")
+    args = parser.parse_args(argv)
+
+    base_wall, base_rows = run_importtime(BASELINE)
+    base_modules = {row[3] for row in base_rows}
+    print(f"baseline `{BASELINE}`: {base_wall * 1000:.0f} ms wall, {len(base_modules)} modules")
+
+    for page in args.pages:
+        code = f"{BASELINE}\nimport sys\nsys.path.insert(0, {str(ROOT_DIR)!r})\n{page_imports(ROOT_DIR / page)}"
+        wall, rows = run_importtime(code)
+        extra = [row for row in rows if row[3] not in base_modules]
+        extra_ms = sum(row[0] for row in extra) / 1000
+        print(f"\n{page}: {wall * 1000:.0f} ms wall, +{extra_ms:.0f} ms in {len(extra)} modules beyond the baseline")
+        top = sorted((row for row in extra if row[2] == 0), key=lambda row: row[1], reverse=True)
+        for self_us, cumulative_us, _, module in top[:args.top]:
+            print(f"  {cumulative_us / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Capture real backend responses into fixture files for ``tools.fake_backend --replay``.
+
+    python -m tools.record_fixtures --out tools/fixtures
+    python -m tools.fake_backend --replay tools/fixtures
+
+Writes ``cities.json`` plus ``current/<city>.json`` and ``history/<city>.json``.
+"""
+import argparse
+import json
+import os
+import sys
+
+import requests
+
+from tools.fake_backend import fixture_path
+
+DEFAULT_BASE_URL = os.getenv("BACKEND_BASE_URL", "https://skyguard-app.onrender.com")
+
+
+def _write(path, payload):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+
+
+def record(base_url, out_dir, cities=None, timeout=30):
+    session = requests.Session()
+
+    def get(path, **params):
+        response = session.get(f"{base_url}{path}", params=params or None, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    all_cities = get("/cities")
+    cities = cities or all_cities
+    _write(fixture_path(out_dir, "cities"), [c for c in all_cities if c in cities])
+
+    for city in cities:
+        try:
+            _write(fixture_path(out_dir, "current", city), get("/aqi/current", city=city))
+            _write(fixture_path(out_dir, "history", city), get("/aqi/last-24-hours", city=city))
+            print(f"recorded {city}")
+        except requests.exceptions.RequestException as e:
+            print(f"skipped {city}: {e}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--out", default="tools/fixtures")
+    parser.add_argument("--city", action="append", dest="cities", help="limit to these cities (repeatable)")
+    args = parser.parse_args(argv)
+    record(args.base_url, args.out, cities=args.cities)
+
+
+if __name__ == "__main__":
+    main()
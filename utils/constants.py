@@ -18,11 +18,4 @@ POLLUTANTS = [
     "nh3"
 ]
 
-CITIES = [
-    "Delhi",
-    "Mumbai",
-    "Ahmedabad",
-    "Bengaluru",
-    "Kolkata",
-    "Chennai"
-]
+# Station names and coordinates: assets/data/stations.csv (services/stations.py).
@@ -0,0 +1,94 @@
+# utils/helpers.py
+from datetime import datetime
+
+
+def format_age(seconds):
+    """Human-readable age such as "45s", "12 min" or "3h 5m"."""
+    if seconds is None:
+        return "unknown"
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60} min"
+    hours, rem = divmod(seconds, 3600)
+    if hours < 48:
+        return f"{hours}h {rem // 60}m"
+    return f"{hours // 24} days"
+
+
+# ---------------- DASHBOARD PRESENTATION ----------------
+def get_safety_advice(aqi):
+    """Actionable health advice with Safe Outdoor Windows."""
+    advice = {
+        1: {
+            "title": "Clean Air - Safe",
+            "desc": "Air quality is ideal for all outdoor activities.",
+            "steps": ["Perfect for outdoor exercise", "Safe for children and elderly", "Open windows for fresh air"],
+            "color": "#22c55e",
+            "safe_window": "Unlimited",
+            "risk_level": "Low",
+            "icon": "check-circle"
+        },
+        2: {
+            "title": "Fair - Low Risk",
+            "desc": "Air quality is acceptable; no special precautions needed.",
+            "steps": ["Regular activity is fine", "Ventilation is safe", "No risk for sensitive groups"],
+            "color": "#84cc16",
+            "safe_window": "4 - 6 Hours",
+            "risk_level": "Minor",
+            "icon": "check-circle"
+        },
+        3: {
+            "title": "Moderate - Warning",
+            "desc": "Sensitive individuals may experience slight health effects.",
+            "steps": ["Sensitive groups should wear masks", "Reduce heavy outdoor exertion", "Close windows if you feel irritation"],
+            "color": "#eab308",
+            "safe_window": "1 - 2 Hours",
+            "risk_level": "Moderate",
+            "icon": "alert-triangle"
+        },
+        4: {
+            "title": "Poor - Unhealthy",
+            "desc": "Everyone may begin to experience health effects.",
+            "steps": ["Avoid outdoor cardio exercise", "Wear N95 masks outdoors", "Use indoor air purifiers"],
+            "color": "#f97316",
+            "safe_window": "30 Minutes",
+            "risk_level": "High",
+            "icon": "alert-circle"
+        },
+        5: {
+            "title": "Very Poor - Hazardous",
+            "desc": "Health warnings for emergency conditions.",
+            "steps": ["Stay indoors strictly", "Keep all windows shut", "High-grade masks mandatory"],
+            "color": "#ef4444",
+            "safe_window": "Avoid Exposure",
+            "risk_level": "Severe",
+            "icon": "alert-octagon"
+        }
+    }
+    return advice.get(aqi, advice[3])
+
+def get_aqi_theme(aqi):
+    """Visual theme with background colors for glassmorphism."""
+    themes = {
+        1: {"label": "GOOD", "color": "#22c55e", "bg_color": "rgba(34, 197, 94, 0.1)"},
+        2: {"label": "FAIR", "color": "#84cc16", "bg_color": "rgba(132, 204, 22, 0.1)"},
+        3: {"label": "MODERATE", "color": "#eab308", "bg_color": "rgba(234, 179, 8, 0.1)"},
+        4: {"label": "POOR", "color": "#f97316", "bg_color": "rgba(249, 115, 22, 0.1)"},
+        5: {"label": "VERY POOR", "color": "#ef4444", "bg_color": "rgba(239, 68, 68, 0.1)"}
+    }
+    return themes.get(aqi, {"label": "UNKNOWN", "color": "#64748b", "bg_color": "rgba(100, 116, 139, 0.1)"})
+
+def format_timestamp(ts):
+    """Format a parsed ``datetime`` (or legacy ISO string) for display."""
+    if ts is None:
+        return "N/A"
+    try:
+        dt = ts if isinstance(ts, datetime) else datetime.fromisoformat(str(ts).replace('Z', '+00:00'))
+        return dt.strftime("%b %d, %Y • %I:%M %p")
+    except:
+        return ts
+
+def format_reading(value, unit):
+    return f"{value} {unit}" if value is not None else "N/A"